@@ -2,45 +2,79 @@ import os
 import tkinter as tk
 from tkinter import scrolledtext
 import threading
-import pyttsx3
 import speech_recognition as sr
 import webbrowser
 import datetime
 from openai import OpenAI
 import subprocess
 import time
+from auli_stream import stream_sentences
+from auli_speech import SpeechWorker, URGENT, NORMAL
+from auli_chatlog import ChatLog
+from auli_router import Router, load_plugins, normalize
+from auli_classifier import IntentClassifier
 
 # ==================== CONFIGURATION ====================
 OPENROUTER_API_KEY = "sk-or-v1-API KEY HERE"
+# Point AULI_BASE_URL at auli_mock_server.py (http://127.0.0.1:8765/v1) to try it offline.
+AULI_BASE_URL = os.environ.get("AULI_BASE_URL", "https://openrouter.ai/api/v1")
+MODEL = "tngtech/deepseek-r1t2-chimera:free"
+SYSTEM_PROMPT = "You are AULI, a multilingual smart desktop assistant."
+STREAMING = True  # speak each sentence as it arrives instead of after the whole answer
+CHAT_MAX_LINES = 2000  # older lines are moved to HISTORY_FILE
+HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "auli_history.txt")
+PLUGIN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins")
+TRAINING_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "auli_training.tsv")
 
 client = OpenAI(
-    base_url="https://openrouter.ai/api/v1",
+    base_url=AULI_BASE_URL,
     api_key=OPENROUTER_API_KEY,
 )
 
-engine = pyttsx3.init()
-engine.setProperty('rate', 175)
-engine.setProperty('voice', engine.getProperty('voices')[1].id)  # female voice
+# The worker thread owns the pyttsx3 engine; speak() only queues text.
+speech = SpeechWorker(rate=175, voice_index=1).start()  # female voice
+# Each command thread records the speech generation it answers, so its
+# replies are dropped once the user has moved on to another command.
+command_turn = threading.local()
 
 
 # ==================== SPEAK FUNCTION ====================
-def speak(text):
-    chat_box.configure(state='normal')
-    chat_box.insert(tk.END, f"\n🟢 AULI: ", "auli_tag")
-    chat_box.insert(tk.END, text + "\n", "auli_text")
-    chat_box.configure(state='disabled')
-    chat_box.see(tk.END)
-    engine.say(text)
-    engine.runAndWait()
+def speak(text, new_turn=True, end="\n", priority=NORMAL):
+    # new_turn=False continues the current AULI line (streamed sentences).
+    # Returns at once; speech.wait() blocks until it has been spoken.
+    if new_turn:
+        chat_log.post(f"\n🟢 AULI: ", "auli_tag")
+    chat_log.post(text + end, "auli_text")
+    speech.say(text, priority, current_turn())
+
+
+def current_turn():
+    # Generation of the command this thread is answering, None outside one.
+    return getattr(command_turn, "generation", None)
+
+
+def start_command(target, *args):
+    # Runs target on a new thread as a fresh command; older speech is stale.
+    generation = speech.new_command()
+
+    def run():
+        command_turn.generation = generation
+        target(*args)
+    threading.Thread(target=run).start()
+
+
+def show_user(query):
+    chat_log.post(f"\n🟣 You: ", "user_tag")
+    chat_log.post(query + "\n", "user_text")
 
 
 # ==================== AI CHAT RESPONSE ====================
 def chat_with_auli(prompt):
     try:
         response = client.chat.completions.create(
-            model="tngtech/deepseek-r1t2-chimera:free",
+            model=MODEL,
             messages=[
-                {"role": "system", "content": "You are AULI, a multilingual smart desktop assistant."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
         )
@@ -49,101 +83,175 @@ def chat_with_auli(prompt):
         return f"⚠️ Error: {e}"
 
 
+def stream_with_auli(prompt):
+    # Streaming version: each sentence is shown and spoken as soon as it is
+    # complete, so the first audio waits for one sentence, not the whole answer.
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+    first = True
+    turn = current_turn()
+    try:
+        for sentence in stream_sentences(client, MODEL, messages):
+            if turn is not None and speech.generation != turn:
+                break  # the user moved on; stop reading the old answer
+            speak(sentence, new_turn=first, end=" ")
+            first = False
+    except Exception as e:
+        speak(f"⚠️ Error: {e}", new_turn=first, priority=URGENT)
+        return
+    if first:
+        speak("Sorry, I got an empty answer.")
+    else:
+        chat_log.post("\n", "auli_text")
+
+
 # ==================== OPEN APPLICATIONS ====================
+WEBSITES = {
+    "youtube": ("YouTube", "https://youtube.com"),
+    "google": ("Google", "https://google.com"),
+    "gmail": ("Gmail", "https://mail.google.com"),
+}
+
+APP_PATHS = {
+    "word": r"C:\Program Files\Microsoft Office\root\Office16\WINWORD.EXE",
+    "excel": r"C:\Program Files\Microsoft Office\root\Office16\EXCEL.EXE",
+    "powerpoint": r"C:\Program Files\Microsoft Office\root\Office16\POWERPNT.EXE",
+    "chrome": r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    "browser": r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    "vs code": r"C:\Users\asus\AppData\Local\Programs\Microsoft VS Code\Code.exe",
+    "notepad": "notepad.exe",
+    "paint": "mspaint.exe",
+    "calculator": "calc.exe",
+    "file explorer": "explorer.exe",
+    "command prompt": "cmd.exe",
+    "edge": r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+}
+
+
+def find_name(text, names):
+    # The longest of names that appears in text as whole words, or None;
+    # "password manager" doesn't contain the app "word".
+    padded = f" {normalize(text)} "
+    return next((name for name in sorted(names, key=len, reverse=True) if f" {name} " in padded), None)
+
+
 def open_application(app_name):
-    app_name = app_name.lower()
-    paths = {
-        "word": r"C:\Program Files\Microsoft Office\root\Office16\WINWORD.EXE",
-        "excel": r"C:\Program Files\Microsoft Office\root\Office16\EXCEL.EXE",
-        "powerpoint": r"C:\Program Files\Microsoft Office\root\Office16\POWERPNT.EXE",
-        "chrome": r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-        "vs code": r"C:\Users\asus\AppData\Local\Programs\Microsoft VS Code\Code.exe",
-        "notepad": "notepad.exe",
-        "paint": "mspaint.exe",
-        "calculator": "calc.exe",
-        "file explorer": "explorer.exe",
-        "command prompt": "cmd.exe",
-        "edge": r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe"
-    }
-
-    for key, path in paths.items():
-        if key in app_name:
-            try:
-                os.startfile(path)
-                speak(f"Opening {key} for you.")
-                return True
-            except Exception as e:
-                speak(f"Sorry, I couldn’t open {key}. Error: {e}")
-                return True
-    return False
+    key = find_name(app_name, APP_PATHS)
+    if key is None:
+        return False
+    try:
+        os.startfile(APP_PATHS[key])
+        speak(f"Opening {key} for you.")
+    except Exception as e:
+        speak(f"Sorry, I couldn’t open {key}. Error: {e}")
+    return True
 
 
 # ==================== COMMAND HANDLER ====================
-def process_command(query):
-    query = query.lower().strip()
+# Intents and their patterns live in auli_router.INTENTS; each handler gets
+# the pattern's slots as keyword arguments. Returning False sends the query
+# to the AI instead. Extra commands can be dropped into plugins/ as modules
+# with a register(router) function.
+router = Router()
+
+
+@router.command("open_website")
+def open_website(site):
+    name, url = WEBSITES[site]
+    webbrowser.open(url)
+    speak(f"Opening {name}.")
 
-    # Open applications
-    if "open" in query:
-        app_name = query.replace("open", "").strip()
-        if open_application(app_name):
-            return
 
-    # Play Music
-    elif "play music" in query:
+@router.command("open_app")
+def open_app(app):
+    return open_application(app)
+
+
+@router.command("play_music")
+def play_music(song=None):
+    if song is None:
         speak("What’s your favorite song, Madhav?")
+        speech.wait(10)  # don't record our own question
         song = listen_once()
-        if song:
-            speak(f"Playing {song} on YouTube.")
-            webbrowser.open(f"https://www.youtube.com/results?search_query={song}")
-        else:
-            speak("I couldn’t hear your favorite song.")
-        return
+    if song:
+        speak(f"Playing {song} on YouTube.")
+        webbrowser.open(f"https://www.youtube.com/results?search_query={song}")
+    else:
+        speak("I couldn’t hear your favorite song.")
 
-    # Time & Date
-    elif "time" in query:
-        current_time = datetime.datetime.now().strftime("%I:%M %p")
-        speak(f"The current time is {current_time}.")
-        return
 
-    elif "date" in query:
-        current_date = datetime.date.today().strftime("%B %d, %Y")
-        speak(f"Today’s date is {current_date}.")
-        return
+@router.command("time")
+def tell_time():
+    current_time = datetime.datetime.now().strftime("%I:%M %p")
+    speak(f"The current time is {current_time}.")
 
-    # Websites
-    elif "open youtube" in query:
-        webbrowser.open("https://youtube.com")
-        speak("Opening YouTube.")
-        return
-    elif "open google" in query:
-        webbrowser.open("https://google.com")
-        speak("Opening Google.")
-        return
-    elif "open gmail" in query:
-        webbrowser.open("https://mail.google.com")
-        speak("Opening Gmail.")
-        return
 
-    # System commands
-    elif "shutdown" in query:
-        speak("Shutting down the system in 10 seconds.")
-        os.system("shutdown /s /t 10")
-        return
-    elif "restart" in query:
-        speak("Restarting your system now.")
-        os.system("shutdown /r /t 5")
-        return
+@router.command("date")
+def tell_date():
+    current_date = datetime.date.today().strftime("%B %d, %Y")
+    speak(f"Today’s date is {current_date}.")
 
-    # Exit
-    elif any(word in query for word in ["exit", "quit", "close auli", "stop"]):
-        speak("Goodbye Madhav! Have a great day.")
-        root.destroy()
-        return
 
-    # Otherwise, ask AI
+@router.command("shutdown")
+def shutdown():
+    speak("Shutting down the system in 10 seconds.", priority=URGENT)
+    os.system("shutdown /s /t 10")
+
+
+@router.command("restart")
+def restart():
+    speak("Restarting your system now.", priority=URGENT)
+    os.system("shutdown /r /t 5")
+
+
+@router.command("exit")
+def exit_auli():
+    speak("Goodbye Madhav! Have a great day.")
+    speech.wait(5)
+    chat_log.call(close_window)
+
+
+# Paraphrased commands the patterns miss ("what's the clock say") are caught
+# by the local classifier instead of a slow LLM round trip. Exit, shutdown
+# and restart are left out on purpose: they need the explicit command. So is
+# play_music, which would open the microphone on a false positive ("play it
+# cool"); the "play ..." patterns in auli_router cover it. The classifier's
+# per-intent thresholds (auli_classifier.INTENT_THRESHOLDS) keep its measured
+# precision at 100%, and an open command also needs a known app or site
+# name in the query; without one it goes to the LLM.
+classifier = IntentClassifier.from_file(TRAINING_FILE)
+
+
+def open_named(query, names, opener):
+    name = find_name(query, names)
+    return False if name is None else opener(name)
+
+
+FAST_PATH = {
+    "time": lambda query: tell_time(),
+    "date": lambda query: tell_date(),
+    "open_app": lambda query: open_named(query, APP_PATHS, open_application),
+    "open_website": lambda query: open_named(query, WEBSITES, open_website),
+}
+
+
+def ask_ai(query):
+    intent, _ = classifier.predict(query)  # None below the intent's threshold, or for questions
+    if intent in FAST_PATH and FAST_PATH[intent](query) is not False:
+        return
+    if STREAMING:
+        stream_with_auli(query)
     else:
-        response = chat_with_auli(query)
-        speak(response)
+        speak(chat_with_auli(query))
+
+
+load_plugins(router, PLUGIN_DIR)
+
+
+def process_command(query):
+    router.dispatch(query.strip(), ask_ai)
 
 
 # ==================== VOICE RECOGNITION ====================
@@ -161,14 +269,11 @@ def listen_voice():
     recognizer = sr.Recognizer()
     with sr.Microphone() as source:
         speak("Listening...")
+        speech.wait(10)
         try:
             audio = recognizer.listen(source, timeout=5)
             query = recognizer.recognize_google(audio)
-            chat_box.configure(state='normal')
-            chat_box.insert(tk.END, f"\n🟣 You: ", "user_tag")
-            chat_box.insert(tk.END, query + "\n", "user_text")
-            chat_box.configure(state='disabled')
-            chat_box.see(tk.END)
+            show_user(query)
             process_command(query)
         except sr.WaitTimeoutError:
             speak("No speech detected.")
@@ -181,17 +286,22 @@ def send_text():
     query = user_input.get()
     if not query.strip():
         return
-    chat_box.configure(state='normal')
-    chat_box.insert(tk.END, f"\n🟣 You: ", "user_tag")
-    chat_box.insert(tk.END, query + "\n", "user_text")
-    chat_box.configure(state='disabled')
-    chat_box.see(tk.END)
+    show_user(query)
     user_input.delete(0, tk.END)
-    threading.Thread(target=lambda: process_command(query)).start()
+    start_command(process_command, query)  # whatever AULI was still saying is stale now
 
 
 def start_listening_thread():
-    threading.Thread(target=listen_voice).start()
+    start_command(listen_voice)
+
+
+def stop_speaking(event=None):
+    speech.interrupt()
+
+
+def close_window():
+    speech.close()
+    root.destroy()
 
 
 # ==================== UI SETUP ====================
@@ -228,6 +338,7 @@ chat_box.tag_config("user_text", foreground="#caf0f8")
 chat_box.tag_config("auli_tag", foreground="#00ffb3", font=("Consolas", 12, "bold"))
 chat_box.tag_config("auli_text", foreground="#ade8f4")
 chat_box.configure(state='disabled')
+chat_log = ChatLog(root, chat_box, max_lines=CHAT_MAX_LINES, history_path=HISTORY_FILE)
 
 # Input Frame
 input_frame = tk.Frame(root, bg="#05081a")
@@ -270,6 +381,21 @@ voice_btn = tk.Button(
 )
 voice_btn.pack(side=tk.LEFT, ipadx=10, ipady=6)
 
+stop_btn = tk.Button(
+    input_frame,
+    text="🔇 Stop",
+    font=("Poppins SemiBold", 12),
+    bg="#f87171",
+    fg="#0f172a",
+    activebackground="#ef4444",
+    activeforeground="white",
+    relief=tk.FLAT,
+    command=stop_speaking
+)
+stop_btn.pack(side=tk.LEFT, padx=5, ipadx=10, ipady=6)
+root.bind("<Escape>", stop_speaking)
+root.protocol("WM_DELETE_WINDOW", close_window)
+
 speak("Hello Madhav! I’m AULI — your futuristic AI assistant. I can open apps, play music, and chat with you anytime.")
 
 root.mainloop()
@@ -0,0 +1,69 @@
+import queue
+
+# Thread-safe rendering for AULI's chat box. Worker threads only post
+# (text, tag) pieces; the Tk thread drains the queue once per frame with
+# root.after, inserting everything that arrived in one go. Long answers are
+# split into pieces and the per-frame character budget spreads them over
+# several frames, so the window keeps repainting. The widget is capped at
+# max_lines; trimmed lines are appended to a history file first.
+
+FRAME_MS = 16           # about 60 drains per second
+PIECE_CHARS = 256       # long texts are queued in pieces of this size
+FRAME_CHARS = 4096      # at most this much text is inserted per frame
+
+
+class ChatLog:
+    def __init__(self, root, chat_box, max_lines=2000, history_path=None):
+        self.root = root
+        self.chat_box = chat_box
+        self.max_lines = max_lines
+        self.history_path = history_path
+        self.queue = queue.SimpleQueue()
+        self.root.after(FRAME_MS, self.drain)
+
+    # ---- Called from any thread ---- #
+    def post(self, text, tag=None):
+        for start in range(0, len(text), PIECE_CHARS):
+            self.queue.put((text[start:start + PIECE_CHARS], tag))
+
+    def call(self, function, *args):
+        # Runs function(*args) on the Tk thread, in order with the text.
+        self.queue.put((function, args))
+
+    # ---- Tk thread ---- #
+    def drain(self):
+        budget = FRAME_CHARS
+        inserted = False
+        while budget > 0:
+            try:
+                item, extra = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if callable(item):
+                item(*extra)
+                continue
+            if not inserted:
+                self.chat_box.configure(state='normal')
+                inserted = True
+            self.chat_box.insert("end", item, extra)
+            budget -= len(item)
+        if inserted:
+            self.trim()
+            self.chat_box.configure(state='disabled')
+            self.chat_box.see("end")
+        try:
+            self.root.after(FRAME_MS, self.drain)
+        except Exception:
+            pass  # window closed
+
+    def trim(self):
+        # Removes the oldest lines plus a tenth of the cap, so trimming
+        # happens once in a while rather than on every frame.
+        lines = int(self.chat_box.index("end-1c").split(".")[0])
+        if lines <= self.max_lines:
+            return
+        cut = f"{lines - self.max_lines + self.max_lines // 10 + 1}.0"
+        if self.history_path:
+            with open(self.history_path, "a", encoding="utf-8") as history:
+                history.write(self.chat_box.get("1.0", cut))
+        self.chat_box.delete("1.0", cut)
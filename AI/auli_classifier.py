@@ -0,0 +1,216 @@
+import argparse
+import math
+import os
+import time
+from collections import Counter, defaultdict
+from auli_router import normalize, read_corpus
+
+# On-device intent classifier for queries the command patterns miss
+# ("what's the clock say", "launch my browser"). TF-IDF vectors of character
+# n-grams inside each word plus the words themselves, one centroid per
+# intent, cosine similarity to the nearest one. Confidence is the margin over
+# the runner-up: a query that is about as close to two intents is ambiguous.
+# Answers below their intent's threshold, or in the "chat" class, go to the LLM,
+# and so do questions ("who invented the calculator") classed as an action.
+#
+# Each intent has its own threshold, calibrated on leave-one-out predictions:
+# SAFETY above the most confident wrong answer for that intent, so every
+# answer that clears it was right. A false positive runs a real action, a
+# false negative only costs an LLM round trip.
+#
+#   python auli_classifier.py              accuracy, precision and latency report
+#   python auli_classifier.py --calibrate  prints INTENT_THRESHOLDS for this data
+
+CHAT = "chat"
+NGRAMS = (3, 4, 5)
+WORD_WEIGHT = 2.0  # whole words count more than any single n-gram
+THRESHOLD = 0.1    # minimum margin of the best centroid over the second, for any intent
+SAFETY = 0.05      # calibrated thresholds sit this far above the worst wrong answer
+# Intents that do something; a question is never one of them.
+ACTIONS = frozenset({"open_app", "open_website", "play_music", "exit", "shutdown", "restart"})
+QUESTION_WORDS = frozenset({"who", "what", "what's", "when", "where", "why", "how", "which", "whose",
+                            "is", "are", "was", "were", "do", "does", "did"})
+
+# From --calibrate on auli_training.tsv; re-run it after editing the data.
+INTENT_THRESHOLDS = {
+    "date": 0.2,
+    "exit": 0.1,
+    "open_app": 0.15,
+    "open_website": 0.18,
+    "play_music": 0.1,
+    "restart": 0.1,
+    "shutdown": 0.27,
+    "time": 0.15,
+}
+
+
+def features(text):
+    # Sublinear counts of the n-grams of each " word ", plus "w:word" terms.
+    words = normalize(text).split()
+    counts = Counter()
+    for word in words:
+        padded = f" {word} "
+        counts.update(padded[i:i + n] for n in NGRAMS for i in range(len(padded) - n + 1))
+    vector = {gram: 1 + math.log(count) for gram, count in counts.items()}
+    for word in words:
+        vector["w:" + word] = WORD_WEIGHT
+    return vector
+
+
+def is_question(text):
+    words = normalize(text).split()
+    return bool(words) and words[0] in QUESTION_WORDS
+
+
+def unit(vector):
+    norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+    return {key: w / norm for key, w in vector.items()}
+
+
+class IntentClassifier:
+    def __init__(self, examples, threshold=THRESHOLD, thresholds=None):
+        # examples: (utterance, intent) pairs; thresholds: intent -> minimum
+        # margin, INTENT_THRESHOLDS by default. threshold is the floor.
+        self.threshold = threshold
+        self.thresholds = INTENT_THRESHOLDS if thresholds is None else thresholds
+        grams = [(features(text), intent) for text, intent in examples]
+        document_frequency = Counter(gram for vector, _ in grams for gram in vector)
+        total = len(grams)
+        self.idf = {gram: math.log((1 + total) / (1 + df)) + 1 for gram, df in document_frequency.items()}
+
+        sums = defaultdict(Counter)
+        for vector, intent in grams:
+            sums[intent].update(self.vectorize(vector))
+        self.intents = sorted(sums)
+        # Inverted index: n-gram -> [(intent, centroid weight)], so scoring a
+        # query only touches the n-grams it shares with the training data.
+        self.index = defaultdict(list)
+        for intent in self.intents:
+            for gram, weight in unit(sums[intent]).items():
+                self.index[gram].append((intent, weight))
+
+    @classmethod
+    def from_file(cls, path, threshold=THRESHOLD, thresholds=None):
+        return cls([(text, intent) for text, intent, _ in read_corpus(path)], threshold, thresholds)
+
+    def vectorize(self, vector):
+        return unit({gram: w * self.idf[gram] for gram, w in vector.items() if gram in self.idf})
+
+    def scores(self, text):
+        score = dict.fromkeys(self.intents, 0.0)
+        for gram, weight in self.vectorize(features(text)).items():
+            for intent, centroid in self.index[gram]:
+                score[intent] += weight * centroid
+        return score
+
+    def rank(self, text):
+        # The nearest intent and its margin over the runner-up, no threshold.
+        score = self.scores(text)
+        best, second = sorted(score.values(), reverse=True)[:2]
+        return max(score, key=score.get), best - second
+
+    def cutoff(self, intent):
+        return max(self.threshold, self.thresholds.get(intent, self.threshold))
+
+    def accepts(self, text, intent, confidence):
+        if intent == CHAT or confidence < self.cutoff(intent):
+            return False
+        return intent not in ACTIONS or not is_question(text)
+
+    def predict(self, text):
+        # Returns (intent, confidence); intent is None when the query should go
+        # to the LLM (open-ended, too close to call, or a question).
+        intent, confidence = self.rank(text)
+        if not self.accepts(text, intent, confidence):
+            return None, confidence
+        return intent, confidence
+
+
+# ---------------- Reports ---------------- #
+def leave_one_out(examples):
+    # Each example ranked by a model trained on all the others; returns a
+    # list of (utterance, expected, nearest intent, margin), no thresholds.
+    results = []
+    for i, (text, intent) in enumerate(examples):
+        model = IntentClassifier(examples[:i] + examples[i + 1:])
+        results.append((text, intent, *model.rank(text)))
+    return results
+
+
+def calibrate(results, threshold=THRESHOLD, safety=SAFETY):
+    # intent -> the smallest margin above every wrong leave-one-out answer
+    # for that intent (plus safety), so the kept answers are all correct.
+    # Questions classed as actions are rejected anyway and don't count.
+    thresholds = {}
+    for intent in sorted({expected for _, expected, _, _ in results} - {CHAT}):
+        wrong = [margin for text, expected, nearest, margin in results
+                 if nearest == intent != expected and not (intent in ACTIONS and is_question(text))]
+        thresholds[intent] = round(max(threshold, max(wrong, default=0.0) + safety), 2)
+    return thresholds
+
+
+def apply_thresholds(results, model):
+    # (utterance, expected, predicted) with predicted CHAT where model.predict would say None.
+    return [(text, expected, nearest if model.accepts(text, nearest, margin) else CHAT)
+            for text, expected, nearest, margin in results]
+
+
+def latency(model, texts, repeats=50):
+    # Per-query times in microseconds: (mean, 99th percentile).
+    times = []
+    for _ in range(repeats):
+        for text in texts:
+            start = time.perf_counter()
+            model.predict(text)
+            times.append((time.perf_counter() - start) * 1e6)
+    times.sort()
+    return sum(times) / len(times), times[int(len(times) * 0.99)]
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Accuracy and latency report for the AULI intent classifier.")
+    parser.add_argument("data", nargs="?", default=os.path.join(here, "auli_training.tsv"))
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="floor for every intent's threshold")
+    parser.add_argument("--calibrate", action="store_true",
+                        help="report with thresholds calibrated on this data and print them")
+    args = parser.parse_args()
+
+    examples = [(text, intent) for text, intent, _ in read_corpus(args.data)]
+    ranked = leave_one_out(examples)
+    thresholds = calibrate(ranked, args.threshold) if args.calibrate else None
+    model = IntentClassifier(examples, args.threshold, thresholds)
+    results = apply_thresholds(ranked, model)
+    correct = sum(expected == predicted for _, expected, predicted in results)
+    print(f"leave-one-out accuracy {correct}/{len(results)} = {correct / len(results):.1%}")
+    by_intent = defaultdict(lambda: [0, 0, 0])  # correct, examples, predicted
+    for _, expected, predicted in results:
+        by_intent[expected][0] += expected == predicted
+        by_intent[expected][1] += 1
+        by_intent[predicted][2] += 1
+    print(f"  {'intent':<14}{'recall':>8}{'precision':>11}{'threshold':>11}")
+    for intent, (hits, count, predicted) in sorted(by_intent.items()):
+        precision = f"{hits}/{predicted}" if predicted else "-"
+        cutoff = "-" if intent == CHAT else f"{model.cutoff(intent):.2f}"
+        print(f"  {intent:<14}{f'{hits}/{count}':>8}{precision:>11}{cutoff:>11}")
+    commands_to_llm = sum(expected != CHAT and predicted == CHAT for _, expected, predicted in results)
+    chat_as_command = sum(expected == CHAT and predicted != CHAT for _, expected, predicted in results)
+    print(f"commands sent to the LLM: {commands_to_llm}, open questions taken as commands: {chat_as_command}")
+    for text, expected, predicted in results:
+        if expected != predicted:
+            print(f"  miss {text!r}: {expected} -> {predicted}")
+
+    start = time.perf_counter()
+    model = IntentClassifier(examples, args.threshold, thresholds)
+    train_ms = (time.perf_counter() - start) * 1e3
+    mean, p99 = latency(model, [text for text, _ in examples])
+    print(f"train {train_ms:.1f} ms, predict {mean:.0f} µs mean, {p99:.0f} µs p99")
+    if thresholds is not None:
+        print("INTENT_THRESHOLDS = {")
+        for intent, cutoff in thresholds.items():
+            print(f"    {intent!r}: {cutoff},")
+        print("}")
+
+
+if __name__ == "__main__":
+    main()
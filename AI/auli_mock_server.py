@@ -0,0 +1,100 @@
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Offline stand-in for the OpenAI-compatible chat completions endpoint.
+# It answers every prompt with a canned reply, streamed word by word as
+# server-sent events when the request asks for stream=True, so AULI's
+# streaming path can be tried without an API key:
+#
+#   python auli_mock_server.py --port 8765 --delay 0.08
+#   set AULI_BASE_URL=http://127.0.0.1:8765/v1   (then run AULI_MK5.py)
+
+REPLY = ("Sure, here is a quick answer. Streaming lets me start talking after the first sentence "
+         "instead of waiting for the whole reply. Each sentence is shown and spoken as soon as it "
+         "is complete. This is the local mock server, so the text is always the same. You asked: {prompt}")
+
+
+def reply_for(body):
+    messages = body.get("messages") or [{}]
+    return REPLY.format(prompt=messages[-1].get("content", ""))
+
+
+def chunk(model, text=None, finish=None):
+    delta = {"content": text} if text is not None else {}
+    return {
+        "id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+    }
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    delay = 0.05  # seconds between streamed words; set per server
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        model = body.get("model", "mock")
+        text = reply_for(body)
+        if body.get("stream"):
+            self.stream(model, text)
+        else:
+            self.send_json({
+                "id": "chatcmpl-mock", "object": "chat.completion", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            })
+
+    def stream(self, model, text):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        words = text.split(" ")
+        events = [chunk(model, word if i == 0 else " " + word) for i, word in enumerate(words)]
+        events.append(chunk(model, finish="stop"))
+        for event in events:
+            self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            time.sleep(self.delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def send_json(self, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_server(port=0, delay=0.05):
+    # Serves on a daemon thread; returns (server, base_url). Port 0 picks a free port.
+    handler = type("Handler", (MockHandler,), {"delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local streaming mock of the chat completions API.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.05, help="seconds between streamed words")
+    args = parser.parse_args()
+    server, url = start_mock_server(args.port, args.delay)
+    print(f"Mock chat completions at {url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
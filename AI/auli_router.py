@@ -0,0 +1,197 @@
+import argparse
+import importlib.util
+import os
+import re
+import time
+
+# Intent routing for AULI commands. Intents are declared as data (name,
+# priority, patterns); the router compiles every pattern into one anchored
+# regex whose alternatives are ordered by priority, so a single match finds
+# the highest-priority intent that covers the whole utterance and its slots.
+# Named groups in a pattern, e.g. (?P<app>.+), become handler arguments.
+#
+# Anything that isn't a command (e.g. "how much time does light take to reach
+# us") matches nothing and goes to the LLM.
+#
+#   python auli_router.py                 check auli_intents.tsv and time routing
+
+# Politeness and wake words around a command; they never change the intent.
+PREFIX = r"(?:(?:hey|hi|ok|okay) )?(?:auli )?(?:(?:please|can you|could you|would you|will you|i want to|i want you to) )*"
+SUFFIX = r"(?: (?:please|for me|now|right now|auli))*"
+
+INTENTS = [
+    # name, priority, patterns
+    ("open_website", 30, [r"(?:open|go to|launch) (?P<site>youtube|google|gmail)(?: com)?"]),
+    ("open_app", 20, [r"(?:open|launch|start|run) (?:the |my )?(?P<app>[a-z][a-z ]*?)(?: app| application)?"]),
+    # "play <anything>" alone is too broad ("play a game with me"): a song
+    # needs "song", "on youtube" or "by <artist>" to be recognised.
+    ("play_music", 20, [r"play (?:some |me some )?(?:music|songs?)",
+                        r"play (?:me )?(?:the |a )?(?:song|track) (?P<song>.+?)(?: on youtube)?",
+                        r"play (?P<song>.+?) on youtube",
+                        r"play (?P<song>.+? by .+)"]),
+    ("time", 10, [r"(?:what(?:'s| is) )?(?:the )?(?:current )?time(?: is it)?(?: now)?",
+                  r"what time is it(?: now)?", r"tell me the time"]),
+    ("date", 10, [r"(?:what(?:'s| is) )?(?:today's |the )?(?:current )?date(?: today)?",
+                  r"what(?:'s| is) (?:the date|today)(?: today)?", r"what day is (?:it|today)",
+                  r"tell me the date"]),
+    ("shutdown", 10, [r"shut ?down(?: (?:the|my))?(?: (?:system|computer|pc|laptop))?"]),
+    ("restart", 10, [r"(?:restart|reboot)(?: (?:the|my))?(?: (?:system|computer|pc|laptop))?"]),
+    ("exit", 40, [r"exit|quit|stop|close auli|goodbye|bye(?: auli)?|good bye"]),
+]
+
+SLOT = re.compile(r"\(\?P<(\w+)>")
+NOISE = re.compile(r"[^\w' ]+")
+
+
+def normalize(text):
+    # Lowercase, curly quotes to straight, punctuation dropped, spaces collapsed.
+    text = text.lower().replace("’", "'").replace("‘", "'")
+    return " ".join(NOISE.sub(" ", text).split())
+
+
+class Router:
+    def __init__(self, intents=INTENTS):
+        self.intents = {}    # name -> (priority, patterns)
+        self.handlers = {}   # name -> handler(**slots)
+        self.order = []      # registration order, the tie-break for equal priorities
+        self.matcher = None  # compiled lazily, rebuilt after every register()
+        self.groups = {}     # alternative group name -> (intent name, {group name: slot})
+        for name, priority, patterns in intents:
+            self.register(name, patterns, priority)
+
+    def register(self, name, patterns, priority=0, handler=None):
+        # Adds or replaces an intent; plugins call this (or command()).
+        if name not in self.intents:
+            self.order.append(name)
+        self.intents[name] = (priority, list(patterns))
+        if handler is not None:
+            self.handlers[name] = handler
+        self.matcher = None
+
+    def command(self, name, *patterns, priority=0):
+        # Decorator: binds a handler to a known intent, or declares a new one.
+        def bind(handler):
+            if patterns or name not in self.intents:
+                self.register(name, patterns, priority, handler)
+            else:
+                self.handlers[name] = handler
+            return handler
+        return bind
+
+    def compile(self):
+        # Slot groups are renamed per alternative (Python forbids duplicate
+        # group names), and alternatives are ordered by descending priority.
+        ranked = sorted(self.order, key=lambda n: (-self.intents[n][0], self.order.index(n)))
+        alternatives = []
+        self.groups = {}
+        for name in ranked:
+            for pattern in self.intents[name][1]:
+                tag = f"a{len(alternatives)}"
+                slots = {}
+
+                def rename(match, tag=tag, slots=slots):
+                    group = f"{tag}_{match.group(1)}"
+                    slots[group] = match.group(1)
+                    return f"(?P<{group}>"
+                alternatives.append(f"(?P<{tag}>{SLOT.sub(rename, pattern)})")
+                self.groups[tag] = (name, slots)
+        self.matcher = re.compile(f"{PREFIX}(?:{'|'.join(alternatives)}){SUFFIX}")
+        return self.matcher
+
+    def route(self, text):
+        # Returns (intent name, slots), or (None, {}) for open-ended queries.
+        matcher = self.matcher or self.compile()
+        match = matcher.fullmatch(normalize(text))
+        if match is None:
+            return None, {}
+        tag = next(group for group, value in match.groupdict().items()
+                   if value is not None and group in self.groups)
+        name, slots = self.groups[tag]
+        return name, {slot: match.group(group) for group, slot in slots.items() if match.group(group) is not None}
+
+    def dispatch(self, text, fallback):
+        # Runs the matched handler; a handler returning False (or a missing
+        # handler) hands the text to fallback, like an unmatched query.
+        name, slots = self.route(text)
+        handler = self.handlers.get(name)
+        if handler is None or handler(**slots) is False:
+            return fallback(text)
+
+
+def load_plugins(router, directory):
+    # Every *.py in directory with a register(router) function is a plugin.
+    if not os.path.isdir(directory):
+        return []
+    loaded = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".py") or filename.startswith("_"):
+            continue
+        spec = importlib.util.spec_from_file_location(f"auli_plugin_{filename[:-3]}", os.path.join(directory, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if hasattr(module, "register"):
+            module.register(router)
+            loaded.append(filename[:-3])
+    return loaded
+
+
+# ---------------- Corpus check and benchmark ---------------- #
+def read_corpus(path):
+    # Tab-separated: utterance, expected intent ("chat" = goes to the LLM),
+    # then optional slot=value columns. Blank lines and # comments are skipped.
+    cases = []
+    with open(path, encoding="utf-8") as corpus:
+        for line in corpus:
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            utterance, intent, *slots = line.split("\t")
+            cases.append((utterance, intent, dict(slot.split("=", 1) for slot in slots)))
+    return cases
+
+
+def check_corpus(router, cases):
+    # Returns the failures as (utterance, expected, got) tuples.
+    failures = []
+    for utterance, intent, slots in cases:
+        name, found = router.route(utterance)
+        got = (name or "chat", found)
+        if got != (intent, slots if intent != "chat" else {}):
+            failures.append((utterance, (intent, slots), got))
+    return failures
+
+
+def benchmark(router, utterances, repeats=200):
+    # Mean routing time per utterance in microseconds (compile excluded).
+    router.compile()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for utterance in utterances:
+            router.route(utterance)
+    return (time.perf_counter() - start) / (repeats * len(utterances)) * 1e6
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Check AULI intent routing against a corpus and time it.")
+    parser.add_argument("corpus", nargs="?", default=os.path.join(here, "auli_intents.tsv"))
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    router = Router()
+    cases = read_corpus(args.corpus)
+    failures = check_corpus(router, cases)
+    for utterance, expected, got in failures:
+        print(f"FAIL {utterance!r}: expected {expected}, got {got}")
+    print(f"{len(cases) - len(failures)}/{len(cases)} utterances routed as expected")
+
+    start = time.perf_counter()
+    router.compile()
+    compile_ms = (time.perf_counter() - start) * 1e3
+    per_query = benchmark(router, [case[0] for case in cases], args.repeats)
+    print(f"compile {compile_ms:.2f} ms, route {per_query:.1f} µs per utterance")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
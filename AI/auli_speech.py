@@ -0,0 +1,163 @@
+import itertools
+import queue
+import threading
+import pyttsx3
+
+# One long-lived thread owns the pyttsx3 engine; everything else only puts
+# utterances on its queue, so no caller ever blocks on audio and the engine
+# is never touched from two threads.
+#
+# The engine runs its own loop (startLoop(False) + iterate()), polled every
+# few milliseconds. At most AHEAD utterances are in the engine at a time: the
+# one playing and the next, so the driver can synthesize the next sentence
+# while the current one plays. A more urgent one queued meanwhile goes right
+# after those, and stale ones never reach the engine.
+# Each utterance carries the command generation it answers; new_command()
+# makes everything from earlier commands stale.
+
+URGENT, NORMAL = 0, 1
+AHEAD = 2  # utterances handed to the engine at once
+
+
+class SpeechWorker:
+    def __init__(self, rate=175, voice_index=1, poll=0.02):
+        self.rate = rate
+        self.voice_index = voice_index
+        self.poll = poll
+        self.queue = queue.PriorityQueue()
+        self.order = itertools.count()
+        self.generation = 0
+        self.interrupted = threading.Event()
+        self.idle = threading.Event()
+        self.idle.set()
+        self.lock = threading.Lock()
+        self.outstanding = 0  # queued plus playing; idle is set when it reaches 0
+        self.playing = set()  # names of utterances handed to the engine, worker thread only
+        self.closed = False
+        self.dead = False  # set if the engine could not start; say() then does nothing
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    # ---- Called from any thread ---- #
+    def say(self, text, priority=NORMAL, generation=None):
+        # generation: the value new_command() returned when the command being
+        # answered started; None means the current one.
+        if text.strip():
+            with self.lock:
+                if self.dead:
+                    return
+                self.outstanding += 1
+                self.idle.clear()
+                self.queue.put((priority, next(self.order), self.generation if generation is None else generation, text))
+
+    def new_command(self):
+        # Everything queued for earlier commands is stale: drop it and cut
+        # off what is playing now. Returns the new command's generation.
+        with self.lock:
+            self.generation += 1
+            generation = self.generation
+        self.interrupted.set()
+        return generation
+
+    def interrupt(self):
+        # Barge-in: stop talking now, including anything still queued.
+        self.new_command()
+
+    def wait(self, timeout=None):
+        # Blocks until everything queued so far has been spoken (or dropped).
+        return self.idle.wait(timeout)
+
+    def close(self):
+        # Stops the worker thread; called when the window closes.
+        self.closed = True
+        self.interrupted.set()
+
+    # ---- Worker thread ---- #
+    def _run(self):
+        try:
+            engine = pyttsx3.init()
+            engine.setProperty('rate', self.rate)
+            voices = engine.getProperty('voices')
+            if len(voices) > self.voice_index:
+                engine.setProperty('voice', voices[self.voice_index].id)
+        except Exception as error:
+            # No speech on this machine: drop what was queued so wait() returns.
+            print(f"Speech disabled: {error}")
+            self._drop_all()
+            return
+        engine.connect('started-word', lambda name, location, length: self._check_interrupt(engine))
+        engine.connect('finished-utterance', lambda name, completed: self._finished(name))
+        engine.startLoop(False)
+        try:
+            while not self.closed:
+                self._check_interrupt(engine)
+                if len(self.playing) < AHEAD:
+                    self._feed(engine)
+                engine.iterate()
+                self.interrupted.wait(self.poll)  # sleeps, but wakes at once on barge-in
+        finally:
+            engine.endLoop()
+
+    def _feed(self, engine):
+        # Tops the engine up to AHEAD with the most urgent current-generation utterances.
+        while len(self.playing) < AHEAD:
+            try:
+                _, seq, generation, text = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            if generation == self.generation:
+                name = str(seq)
+                self.playing.add(name)
+                engine.say(text, name)
+            else:
+                self._done(1)
+
+    def _check_interrupt(self, engine):
+        if self.interrupted.is_set():
+            self.interrupted.clear()
+            if self.playing:
+                engine.stop()
+                self._done(len(self.playing))
+                self.playing.clear()
+            self._drop_stale()
+
+    def _drop_stale(self):
+        kept = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[2] == self.generation:
+                kept.append(item)
+            else:
+                self._done(1)
+        for item in kept:
+            self.queue.put(item)
+
+    def _drop_all(self):
+        with self.lock:
+            self.dead = True
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            self.outstanding = 0
+            self.idle.set()
+
+    def _finished(self, name):
+        # Drivers may also report utterances cut off by stop(); those are already counted.
+        if name in self.playing:
+            self.playing.discard(name)
+            self._done(1)
+
+    def _done(self, count):
+        with self.lock:
+            self.outstanding -= count
+            if self.outstanding <= 0:
+                self.outstanding = 0
+                self.idle.set()
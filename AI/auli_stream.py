@@ -0,0 +1,68 @@
+import re
+
+# Sentence chunking for streamed LLM answers: tokens arrive a few characters
+# at a time, and each complete sentence is handed on (shown and spoken) as
+# soon as its end is seen instead of after the whole completion.
+
+# A sentence ends at . ! ? or … (plus closing quotes/brackets) followed by
+# whitespace, or at a line break.
+SENTENCE_END = re.compile(r"""([.!?…]+["')\]]*)\s+|\n+""")
+ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e", "approx", "no"}
+MIN_SENTENCE = 12     # shorter pieces are joined to the next sentence
+MAX_SENTENCE = 300    # longer runs without an end are cut at a comma or space
+
+
+class SentenceSplitter:
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, text):
+        # Adds streamed text and returns the sentences it completed.
+        self.buffer += text
+        sentences = []
+        start = 0
+        for match in SENTENCE_END.finditer(self.buffer):
+            end = match.end(1) if match.group(1) else match.start()
+            piece = self.buffer[start:end].strip()
+            if match.group(1) and self.is_abbreviation(piece):
+                continue
+            if len(piece) < MIN_SENTENCE and match.group(1):
+                continue
+            if piece:
+                sentences.append(piece)
+            start = match.end()
+        self.buffer = self.buffer[start:]
+        while len(self.buffer) > MAX_SENTENCE:
+            cut = self.buffer.rfind(", ", 0, MAX_SENTENCE)
+            cut = cut + 1 if cut > 0 else self.buffer.rfind(" ", 0, MAX_SENTENCE)
+            if cut <= 0:
+                cut = MAX_SENTENCE
+            sentences.append(self.buffer[:cut].strip())
+            self.buffer = self.buffer[cut:].lstrip()
+        return sentences
+
+    def flush(self):
+        # Whatever is left once the stream ends.
+        rest, self.buffer = self.buffer.strip(), ""
+        return [rest] if rest else []
+
+    @staticmethod
+    def is_abbreviation(piece):
+        # "Dr." or "e.g." at the end, or a number like "3." in "3.5".
+        word = piece.rsplit(None, 1)[-1].rstrip(".").lower() if piece else ""
+        return word in ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+
+def stream_sentences(client, model, messages, **options):
+    # Yields sentences from a streaming chat completion as they complete.
+    # Reasoning models stream their thinking separately (delta.reasoning);
+    # only the answer content is spoken.
+    splitter = SentenceSplitter()
+    stream = client.chat.completions.create(model=model, messages=messages, stream=True, **options)
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        text = chunk.choices[0].delta.content
+        if text:
+            yield from splitter.feed(text)
+    yield from splitter.flush()
@@ -0,0 +1,186 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from daa_graph import dijkstra_csr, bellman_ford_csr
+from daa_vectorized import bellman_ford_vectorized
+from daa_buckets import dial_dijkstra, radix_dijkstra
+from daa_spfa import spfa_distances
+from daa_delta import delta_stepping
+import daa_generators as gen
+
+
+# ---------------- Graph Shapes ---------------- #
+# Sizes are target edge counts so every shape is compared at a similar |E|.
+
+SHAPES = {
+    "sparse": lambda m, seed, negative: gen.random_sparse(max(2, m // 4), seed=seed, negative=negative),
+    "grid": lambda m, seed, negative: gen.grid(max(2, int((m / 4) ** 0.5)), seed=seed, negative=negative),
+    "scale_free": lambda m, seed, negative: gen.scale_free(max(4, m // 6), seed=seed, negative=negative),
+    "dense": lambda m, seed, negative: gen.dense(max(2, int((2 * m) ** 0.5)), seed=seed, negative=negative),
+}
+
+
+# ---------------- Algorithms ---------------- #
+# max_work caps |V| * |E| for engines whose cost grows with it, so the
+# default sweep finishes in minutes.
+
+ALGORITHMS = {
+    "dijkstra": {"run": dijkstra_csr, "negative": False, "max_work": None},
+    "dijkstra_dial": {"run": dial_dijkstra, "negative": False, "max_work": None},
+    "dijkstra_radix": {"run": radix_dijkstra, "negative": False, "max_work": None},
+    "bellman_ford": {"run": bellman_ford_csr, "negative": True, "max_work": 10 ** 7},
+    "spfa": {"run": spfa_distances, "negative": True, "max_work": None},
+    "delta_stepping": {"run": delta_stepping, "negative": False, "max_work": None},
+    "bellman_ford_vectorized": {"run": lambda g, s: bellman_ford_vectorized(g, s)[0],
+                                "negative": True, "max_work": None},
+}
+
+
+# ---------------- Measurement ---------------- #
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    k = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def measure(run, graph, source, repeats):
+    run(graph, source)  # warm-up
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run(graph, source)
+        samples.append(time.perf_counter() - start)
+
+    # Peak memory comes from a separate traced run so tracing does not skew the timings.
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    run(graph, source)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "median_sec": statistics.median(samples),
+        "p95_sec": percentile(samples, 0.95),
+        "min_sec": min(samples),
+        "peak_bytes": peak,
+    }
+
+
+def git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_suite(sizes, shapes=None, algorithms=None, repeats=5, seed=0, log=print):
+    results = []
+    for shape in shapes or SHAPES:
+        for size in sizes:
+            for negative in (False, True):
+                graph = SHAPES[shape](size, seed, negative)
+                work = graph.num_vertices * graph.num_edges
+                for name in algorithms or ALGORITHMS:
+                    algo = ALGORITHMS[name]
+                    if negative and not algo["negative"]:
+                        continue
+                    if algo["max_work"] is not None and work > algo["max_work"]:
+                        continue
+                    row = {
+                        "shape": shape, "size": size, "negative": negative, "algorithm": name,
+                        "vertices": graph.num_vertices, "edges": graph.num_edges, "repeats": repeats,
+                    }
+                    row.update(measure(algo["run"], graph, 0, repeats))
+                    results.append(row)
+                    if log:
+                        log(f"{shape:>10} {size:>9,} {'neg' if negative else 'pos'} {name:<24} "
+                            f"median {row['median_sec']:.6f}s  p95 {row['p95_sec']:.6f}s  "
+                            f"peak {row['peak_bytes'] / 1e6:.1f} MB")
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def run_scaling(size, shape="sparse", workers=(1, 2, 4, 8), repeats=5, seed=0, log=print):
+    # Delta-stepping at increasing worker counts on one graph; speedup is
+    # relative to the first entry. Pool start-up is part of every run.
+    graph = SHAPES[shape](size, seed, False)
+    results = []
+    for count in workers:
+        row = {"shape": shape, "size": size, "workers": count, "vertices": graph.num_vertices,
+               "edges": graph.num_edges, "repeats": repeats}
+        row.update(measure(lambda g, s: delta_stepping(g, s, workers=count), graph, 0, repeats))
+        row["speedup"] = results[0]["median_sec"] / row["median_sec"] if results else 1.0
+        results.append(row)
+        if log:
+            log(f"{shape:>10} {size:>11,} workers {count:<3} median {row['median_sec']:.6f}s  "
+                f"p95 {row['p95_sec']:.6f}s  speedup x{row['speedup']:.2f}")
+    return {"meta": {"revision": git_revision(), "python": platform.python_version(),
+                     "platform": platform.platform(), "cpus": os.cpu_count(), "seed": seed},
+            "scaling": results}
+
+
+# ---------------- Reports ---------------- #
+
+def case_key(row):
+    return row["shape"], row["size"], row["negative"], row["algorithm"]
+
+
+def compare(old_report, new_report):
+    # Yields (case, old median, new median, new/old ratio) for cases in both reports.
+    old = {case_key(r): r for r in old_report["results"]}
+    for row in new_report["results"]:
+        before = old.get(case_key(row))
+        if before:
+            yield case_key(row), before["median_sec"], row["median_sec"], row["median_sec"] / before["median_sec"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the shortest-path engines on seeded graphs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="target edge counts")
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=None)
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=None)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench_report.json")
+    parser.add_argument("--compare", metavar="OLD_REPORT", help="print median ratios against an earlier report")
+    parser.add_argument("--scaling", type=int, nargs="+", metavar="WORKERS",
+                        help="instead, time delta-stepping at these worker counts (e.g. 1 2 4 8) "
+                             "on the first size and shape")
+    args = parser.parse_args(argv)
+
+    if args.scaling:
+        report = run_scaling(args.sizes[0], (args.shapes or ["sparse"])[0], args.scaling, args.repeats, args.seed)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+        print(f"Wrote {len(report['scaling'])} results to {args.out}")
+        return
+
+    report = run_suite(args.sizes, args.shapes, args.algorithms, args.repeats, args.seed)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=1, sort_keys=True)
+    print(f"Wrote {len(report['results'])} results to {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            old_report = json.load(f)
+        for case, before, after, ratio in compare(old_report, report):
+            flag = "  <-- slower" if ratio > 1.10 else ""
+            print(f"{' '.join(map(str, case)):<55} {before:.6f}s -> {after:.6f}s  x{ratio:.2f}{flag}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
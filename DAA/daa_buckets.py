@@ -0,0 +1,107 @@
+from daa_graph import INF, dijkstra_csr
+
+# Monotone integer priority queues for Dijkstra on non-negative integer
+# weights: no heap comparisons, and stale entries are skipped by checking
+# the stored key against the current distance.
+
+DIAL_MAX_WEIGHT = 4096
+
+
+# ---------------- Dial's Buckets ---------------- #
+
+def dial_dijkstra(graph, source, max_weight=None, progress=None, every=4096):
+    # Circular array of max_weight + 1 buckets: all pending keys lie in
+    # [d, d + max_weight], so bucket d % (max_weight + 1) holds exactly key d.
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    if max_weight is None:
+        max_weight = max(weights, default=0)
+    size = max_weight + 1
+    buckets = [[] for _ in range(size)]
+    distances = [INF] * graph.num_vertices
+    distances[source] = 0
+    buckets[0].append(source)
+    pending, d, settled = 1, 0, 0
+
+    while pending:
+        bucket = buckets[d % size]
+        while not bucket:
+            d += 1
+            bucket = buckets[d % size]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            if distances[u] != d:
+                continue
+            if progress is not None:
+                settled += 1
+                if settled % every == 0:
+                    progress(settled, len(distances))
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                distance = d + weights[i]
+                if distance < distances[v]:
+                    distances[v] = distance
+                    buckets[distance % size].append(v)
+                    pending += 1
+    return distances
+
+
+# ---------------- Radix Heap ---------------- #
+
+def radix_dijkstra(graph, source, progress=None, every=4096):
+    # Bucket i holds keys whose highest bit differing from the last popped
+    # key is bit i - 1; only the lowest non-empty bucket is ever split.
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    buckets = [[] for _ in range(65)]
+    distances = [INF] * graph.num_vertices
+    distances[source] = 0
+    buckets[0].append((0, source))
+    pending, last, settled = 1, 0, 0
+
+    while pending:
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            entries = buckets[i]
+            buckets[i] = []
+            last = min(entries)[0]
+            for key, v in entries:
+                buckets[(key ^ last).bit_length()].append((key, v))
+        d, u = buckets[0].pop()
+        pending -= 1
+        if distances[u] != d:
+            continue
+        if progress is not None:
+            settled += 1
+            if settled % every == 0:
+                progress(settled, len(distances))
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            distance = d + weights[i]
+            if distance < distances[v]:
+                distances[v] = distance
+                buckets[(distance ^ last).bit_length()].append((distance, v))
+                pending += 1
+    return distances
+
+
+# ---------------- Selection ---------------- #
+
+def dial_weight_bound(graph):
+    # The largest weight when Dial's buckets apply (small non-negative
+    # integer weights), otherwise None.
+    low, high = graph.weight_range
+    if graph.integer_weights and graph.num_edges and low >= 0 and high <= DIAL_MAX_WEIGHT:
+        return high
+    return None
+
+
+def bucket_dijkstra(graph, source, progress=None):
+    # Dial's buckets when the weights are small non-negative integers,
+    # otherwise the heapq engine. radix_dijkstra stays available explicitly:
+    # under CPython it benchmarks slightly slower than the C-coded heapq.
+    max_weight = dial_weight_bound(graph)
+    if max_weight is not None:
+        return dial_dijkstra(graph, source, max_weight, progress)
+    return dijkstra_csr(graph, source, progress)
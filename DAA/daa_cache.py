@@ -0,0 +1,84 @@
+import heapq
+from collections import OrderedDict
+
+INF = float('inf')
+
+
+# ---------------- Incremental Update ---------------- #
+
+def insert_edge_update(graph, distances, u, v, w):
+    # Repairs a shortest-path distance map after edge u -> v (weight w) was
+    # added to graph (the dict front end, already containing the edge). Only
+    # vertices whose distance drops are touched, starting from the new edge.
+    # The map is updated in place and returned, or None is returned if the
+    # edge closed a negative cycle.
+    distances.setdefault(u, INF)
+    distances.setdefault(v, INF)
+    if distances[u] + w >= distances[v]:
+        return distances
+    if u == v:
+        return None
+
+    # hops counts edges on each improved path from v; a path longer than
+    # |V| means the new edge made some negative cycle reachable.
+    distances[v] = distances[u] + w
+    hops = {v: 1}
+    limit = len(graph)
+    pq = [(distances[v], v)]
+    while pq:
+        current_distance, node = heapq.heappop(pq)
+        if current_distance > distances[node]:
+            continue
+        for neighbor, weight in graph[node]:
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, INF):
+                if neighbor == u:
+                    # Any improvement to u came through u -> v, so that cycle is negative.
+                    return None
+                hops[neighbor] = hops[node] + 1
+                if hops[neighbor] > limit:
+                    return None
+                distances[neighbor] = distance
+                heapq.heappush(pq, (distance, neighbor))
+    return distances
+
+
+# ---------------- Result Cache ---------------- #
+
+class ResultCache:
+    # LRU cache of distance maps keyed on (algorithm, start, graph version).
+    def __init__(self, capacity=32):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+
+    def get(self, algorithm, start, version):
+        key = (algorithm, start, version)
+        result = self.entries.get(key)
+        if result is not None:
+            self.entries.move_to_end(key)
+        return result
+
+    def put(self, algorithm, start, version, result):
+        key = (algorithm, start, version)
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def apply_edge(self, graph, u, v, w, old_version, new_version):
+        # Carries results from old_version over to new_version after one edge
+        # insertion; anything older is stale and dropped.
+        current = list(self.entries.items())
+        self.entries.clear()
+        for (algorithm, start, version), result in current:
+            if version != old_version:
+                continue
+            if algorithm in ("dijkstra", "delta_stepping") and w < 0:
+                # Neither is defined for negative edges; let them rerun.
+                continue
+            updated = insert_edge_update(graph, result, u, v, w)
+            if updated is not None:
+                self.entries[(algorithm, start, new_version)] = updated
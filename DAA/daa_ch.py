@@ -0,0 +1,459 @@
+import heapq
+import mmap
+import random
+import struct
+import sys
+import time
+from array import array
+from daa_graph import INF, dijkstra_csr
+from daa_store import check_mapping, replace_file
+
+# Contraction hierarchies for repeated point-to-point queries on a static
+# graph with non-negative weights. Preprocessing contracts vertices one at a
+# time, least important first, adding a shortcut u -> w through v unless a
+# witness path shows u -> v -> w is not needed. A query then only searches
+# upward in rank from both ends; how few vertices that touches depends on
+# how hierarchical the graph is (road networks far more than random grids).
+
+# Witness searches are cut off after this many settled vertices; a cut-off
+# only costs an unnecessary shortcut, never a wrong distance. Priorities are
+# estimated with the smaller limit.
+WITNESS_SETTLE_LIMIT = 60
+PRIORITY_SETTLE_LIMIT = 12
+NO_MIDDLE = -1
+
+# Contraction stops once the remaining graph's average degree exceeds this
+# multiple of the input's: on graphs without a hierarchy (random graphs)
+# shortcuts would otherwise multiply. The uncontracted vertices form a core
+# that shares the top rank and is searched like an ordinary graph.
+CORE_DEGREE_FACTOR = 3.0
+
+
+# ---------------- Preprocessing ---------------- #
+
+def adjacency(graph):
+    # Lightest edge per (u, v) pair as {neighbor: (weight, middle)} dicts in
+    # both directions; self-loops never lie on a shortest path.
+    out_adj = [{} for _ in range(graph.num_vertices)]
+    in_adj = [{} for _ in range(graph.num_vertices)]
+    for u, v, w in graph.edges():
+        if w < 0:
+            raise ValueError("Contraction hierarchies need non-negative edge weights.")
+        if u != v and w < out_adj[u].get(v, (INF,))[0]:
+            out_adj[u][v] = (w, NO_MIDDLE)
+            in_adj[v][u] = (w, NO_MIDDLE)
+    return out_adj, in_adj
+
+
+def witness_distances(out_adj, source, skip, bound, targets, limit):
+    # Dijkstra from source that avoids `skip` and stops beyond `bound`, once
+    # every target is settled, or after `limit` settled vertices. Distances
+    # found are upper bounds.
+    distances = {source: 0}
+    pq = [(0, source)]
+    settled = 0
+    remaining = len(targets)
+    while pq and settled < limit:
+        d, u = heapq.heappop(pq)
+        if d > distances[u]:
+            continue
+        if d > bound:
+            break
+        settled += 1
+        if u in targets:
+            remaining -= 1
+            if not remaining:
+                break
+        for v, (w, _) in out_adj[u].items():
+            if v == skip:
+                continue
+            distance = d + w
+            if distance < distances.get(v, INF):
+                distances[v] = distance
+                heapq.heappush(pq, (distance, v))
+    return distances
+
+
+def needed_shortcuts(out_adj, in_adj, v, limit=WITNESS_SETTLE_LIMIT):
+    # (u, w, weight) for every in/out pair whose path through v has no witness.
+    shortcuts = []
+    outgoing = out_adj[v]
+    if not outgoing:
+        return shortcuts
+    longest = max(w for w, _ in outgoing.values())
+    for u, (in_w, _) in in_adj[v].items():
+        distances = witness_distances(out_adj, u, v, in_w + longest, outgoing, limit)
+        for w_vertex, (out_w, _) in outgoing.items():
+            if w_vertex == u:
+                continue
+            through = in_w + out_w
+            if distances.get(w_vertex, INF) > through:
+                shortcuts.append((u, w_vertex, through))
+    return shortcuts
+
+
+def build_hierarchy(graph, progress=None, every=4096):
+    # Returns a ContractionHierarchy. A vertex's priority is four times its
+    # edge difference plus its contracted neighbours plus its level (one above
+    # its highest contracted neighbour), so contraction spreads evenly over
+    # the graph. Priorities are updated lazily: the popped vertex is
+    # re-evaluated and pushed back if it is no longer the smallest.
+    n = graph.num_vertices
+    out_adj, in_adj = adjacency(graph)
+    edges = sum(len(edges) for edges in out_adj)
+    core_degree = CORE_DEGREE_FACTOR * max(1.0, edges / max(n, 1))
+    deleted = [0] * n
+    level = [0] * n
+
+    def priority(v):
+        added = len(needed_shortcuts(out_adj, in_adj, v, PRIORITY_SETTLE_LIMIT))
+        return 4 * (added - len(out_adj[v]) - len(in_adj[v])) + deleted[v] + level[v]
+
+    pq = [(priority(v), v) for v in range(n)]
+    heapq.heapify(pq)
+    rank = [0] * n
+    up = [None] * n
+    down = [None] * n
+    order = 0
+
+    while pq:
+        if edges > core_degree * len(pq):
+            break  # pq holds each remaining vertex exactly once
+        _, v = heapq.heappop(pq)
+        p = priority(v)
+        if pq and p > pq[0][0]:
+            heapq.heappush(pq, (p, v))
+            continue
+        for u, w_vertex, weight in needed_shortcuts(out_adj, in_adj, v):
+            if weight < out_adj[u].get(w_vertex, (INF,))[0]:
+                edges += w_vertex not in out_adj[u]
+                out_adj[u][w_vertex] = (weight, v)
+                in_adj[w_vertex][u] = (weight, v)
+        # Every remaining neighbour is contracted later, so ranks higher.
+        up[v], down[v] = out_adj[v], in_adj[v]
+        neighbours = set(out_adj[v]) | set(in_adj[v])
+        for w_vertex in out_adj[v]:
+            del in_adj[w_vertex][v]
+        for u in in_adj[v]:
+            del out_adj[u][v]
+        edges -= len(out_adj[v]) + len(in_adj[v])
+        out_adj[v], in_adj[v] = {}, {}
+        rank[v] = order
+        order += 1
+        for u in neighbours:
+            deleted[u] += 1
+            level[u] = max(level[u], level[v] + 1)
+        if progress is not None and order % every == 0:
+            progress(order, n)
+    for _, v in pq:
+        # Core: every core edge is kept in both directions under one rank.
+        rank[v] = order
+        up[v], down[v] = out_adj[v], in_adj[v]
+    return ContractionHierarchy(graph.labels, rank, pack(up, graph.integer_weights), pack(down, graph.integer_weights))
+
+
+def pack(lists, integer):
+    # Per-vertex {neighbor: (weight, middle)} dicts -> CSR arrays plus a
+    # parallel array of shortcut middle vertices.
+    offsets, targets = array('q', [0]), array('i')
+    weights, middles = array('q' if integer else 'd'), array('i')
+    for edges in lists:
+        for v, (w, middle) in edges.items():
+            targets.append(v)
+            weights.append(w)
+            middles.append(middle)
+        offsets.append(len(targets))
+    return offsets, targets, weights, middles
+
+
+# ---------------- Queries ---------------- #
+
+class ContractionHierarchy:
+    # up: edges to higher-ranked vertices; down: for each vertex, the
+    # higher-ranked vertices with an edge into it. Both are (offsets,
+    # targets, weights, middles) tuples of flat arrays.
+    def __init__(self, labels, rank, up, down):
+        self.labels = labels
+        self.rank = rank
+        self.up = up
+        self.down = down
+        self._index = None
+        self._core_rank = False  # not computed yet
+
+    @property
+    def num_vertices(self):
+        return len(self.labels)
+
+    @property
+    def num_edges(self):
+        return len(self.up[1]) + len(self.down[1])
+
+    @property
+    def core_rank(self):
+        # The rank shared by the uncontracted core, None without a core.
+        if self._core_rank is False:
+            top = max(self.rank, default=0)
+            self._core_rank = top if sum(1 for r in self.rank if r == top) > 1 else None
+        return self._core_rank
+
+    @property
+    def core_size(self):
+        # Vertices left uncontracted, 0 if none.
+        core = self.core_rank
+        return 0 if core is None else sum(1 for r in self.rank if r == core)
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = {label: i for i, label in enumerate(self.labels)}
+        return self._index
+
+    def upward_search(self, source, target):
+        # Returns (distance, meeting vertex, forward parents, backward parents).
+        # Stall-on-demand: a vertex reached more cheaply through a
+        # higher-ranked neighbour is not expanded, since no shortest path
+        # continues upward from it. Core vertices are only reached here; the
+        # core itself is searched afterwards by core_search.
+        if source == target:
+            return 0, source, {}, {}
+        sides = ((self.up, self.down), (self.down, self.up))
+        distances = ({source: 0}, {target: 0})
+        parents = ({}, {})
+        queues = ([(0, source)], [(0, target)])
+        best, meet = INF, None
+        rank, core = self.rank, self.core_rank
+
+        while queues[0] or queues[1]:
+            # Searches are not stopped at the first meeting: the upward
+            # spaces are small, and each side ends once its keys reach best.
+            for side in (0, 1):
+                queue = queues[side]
+                if not queue:
+                    continue
+                du, u = heapq.heappop(queue)
+                if du >= best:
+                    queue.clear()
+                    continue
+                dist = distances[side]
+                if du > dist[u]:
+                    continue
+                other = distances[1 - side].get(u)
+                if other is not None and du + other < best:
+                    best, meet = du + other, u
+                if rank[u] == core:
+                    continue
+                (offsets, targets, weights, _), (stall_offsets, stall_targets, stall_weights, _) = sides[side]
+                stalled = False
+                for i in range(stall_offsets[u], stall_offsets[u + 1]):
+                    if dist.get(stall_targets[i], INF) + stall_weights[i] < du:
+                        stalled = True
+                        break
+                if stalled:
+                    continue
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    distance = du + weights[i]
+                    if distance < dist.get(v, INF):
+                        dist[v] = distance
+                        parents[side][v] = u
+                        heapq.heappush(queue, (distance, v))
+        if core is not None:
+            best, meet = self.core_search(distances, parents, best, meet)
+        return best, meet, parents[0], parents[1]
+
+    def core_search(self, distances, parents, best, meet):
+        # Bidirectional Dijkstra inside the core, seeded with the core vertices
+        # both upward searches reached; it stops once the two frontiers can
+        # no longer beat best.
+        core, rank = self.core_rank, self.rank
+        queues = [[(d, v) for v, d in distances[side].items() if rank[v] == core] for side in (0, 1)]
+        for queue in queues:
+            heapq.heapify(queue)
+        while queues[0] and queues[1]:
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            du, u = heapq.heappop(queues[side])
+            dist, other = distances[side], distances[1 - side]
+            if du > dist[u]:
+                continue
+            offsets, targets, weights, _ = self.up if side == 0 else self.down
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                distance = du + weights[i]
+                if distance < dist.get(v, INF):
+                    dist[v] = distance
+                    parents[side][v] = u
+                    heapq.heappush(queues[side], (distance, v))
+                if v in other and distance + other[v] < best:
+                    best, meet = distance + other[v], v
+        return best, meet
+
+    def distance(self, source, target):
+        return self.upward_search(source, target)[0]
+
+    def path(self, source, target):
+        # (distance, vertex ids) with every shortcut expanded, or (inf, []).
+        best, meet, forward, backward = self.upward_search(source, target)
+        if meet is None:
+            return INF, []
+        hops = [meet]
+        while hops[-1] != source:
+            hops.append(forward[hops[-1]])
+        hops.reverse()
+        v = meet
+        while v != target:
+            v = backward[v]
+            hops.append(v)
+        path = [source]
+        for u, v in zip(hops, hops[1:]):
+            path.extend(self.unpack(u, v)[1:])
+        return best, path
+
+    def edge_middle(self, u, v):
+        # Middle vertex of the stored u -> v edge; it sits with the lower-ranked
+        # endpoint (for an edge inside the core, in down of v).
+        if self.rank[u] < self.rank[v]:
+            offsets, targets, _, middles = self.up
+            owner, other = u, v
+        else:
+            offsets, targets, _, middles = self.down
+            owner, other = v, u
+        for i in range(offsets[owner], offsets[owner + 1]):
+            if targets[i] == other:
+                return middles[i]
+        raise KeyError((u, v))
+
+    def unpack(self, u, v):
+        stack, path = [(u, v)], [u]
+        while stack:
+            a, b = stack.pop()
+            middle = self.edge_middle(a, b)
+            if middle == NO_MIDDLE:
+                path.append(b)
+            else:
+                stack.append((middle, b))
+                stack.append((a, middle))
+        return path
+
+    def shortest_path(self, start, target):
+        # Label-level query like daa_query.shortest_path: (distance, [labels]).
+        distance, path = self.path(self.index[start], self.index[target])
+        return distance, [self.labels[v] for v in path]
+
+
+# ---------------- Storage ---------------- #
+# Same layout idea as daa_store: header, UTF-8 labels, then 8-byte aligned
+# int32 rank and the two CSR sections, memory-mapped on load.
+
+MAGIC = b"DAACHIER"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIc3xQQQQ")
+EXTENSION = ".daach"
+
+
+def align(position):
+    return (position + 7) & ~7
+
+
+def save_hierarchy(ch, path):
+    if any("\n" in label for label in ch.labels):
+        raise ValueError("Vertex labels may not contain newlines.")
+    labels = "\n".join(ch.labels).encode("utf-8")
+    n = ch.num_vertices
+    weight_code = ch.up[2].typecode.encode()
+    sections = [labels, array('i', ch.rank)]
+    for offsets, targets, weights, middles in (ch.up, ch.down):
+        sections += [offsets, targets, weights, middles]
+    with replace_file(path) as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, weight_code, n, len(labels), len(ch.up[1]), len(ch.down[1])))
+        for section in sections:
+            f.write(b"\0" * (align(f.tell()) - f.tell()))
+            f.write(memoryview(section).cast("B"))
+
+
+def load_hierarchy(path):
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(mapped) < HEADER.size:
+            raise ValueError(f"{path} is not a contraction hierarchy file.")
+        magic, version, weight_code, n, labels_size, up_edges, down_edges = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a contraction hierarchy file.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported hierarchy file version {version}.")
+        if weight_code not in (b"q", b"d"):
+            raise ValueError(f"{path} is corrupt: unknown weight type {weight_code!r}.")
+        # (start, size, typecode) of every section, in file order.
+        layout, position = [], HEADER.size
+        for size, code in [(labels_size, None), (4 * n, "i")] + \
+                [(size, code) for m in (up_edges, down_edges)
+                 for size, code in ((8 * (n + 1), "q"), (4 * m, "i"), (8 * m, weight_code.decode()), (4 * m, "i"))]:
+            position = align(position)
+            layout.append((position, size, code))
+            position += size
+        sections = [(start, size) for start, size, _ in layout]
+        check_mapping(mapped, path, sections, layout[2][0], n, up_edges)
+        check_mapping(mapped, path, sections, layout[6][0], n, down_edges)
+        labels = mapped[layout[0][0]:layout[0][0] + labels_size].decode("utf-8").split("\n") if n else []
+        if len(labels) != n:
+            raise ValueError(f"{path} is corrupt: expected {n} labels, found {len(labels)}.")
+    except BaseException:
+        mapped.close()
+        raise
+
+    view = memoryview(mapped)
+    rank, *arrays = [view[start:start + size].cast(code) for start, size, code in layout[1:]]
+    csr = [tuple(arrays[:4]), tuple(arrays[4:])]
+    ch = ContractionHierarchy(labels, rank, csr[0], csr[1])
+    ch.mapped_file = mapped  # keeps the mapping alive as long as the hierarchy
+    return ch
+
+
+# ---------------- Cross-check ---------------- #
+
+def verify(graph, ch, sources=20, targets=200, seed=0):
+    # Compares query distances with dijkstra_csr from random sources and
+    # returns the mean query time in seconds.
+    rng = random.Random(seed)
+    n = graph.num_vertices
+    elapsed, count = 0.0, 0
+    for _ in range(sources):
+        source = rng.randrange(n)
+        expected = dijkstra_csr(graph, source)
+        for _ in range(targets):
+            target = rng.randrange(n)
+            start = time.perf_counter()
+            distance = ch.distance(source, target)
+            elapsed += time.perf_counter() - start
+            count += 1
+            assert distance == expected[target], f"distance mismatch for {source} -> {target}"
+    return elapsed / max(count, 1)
+
+
+def main(argv=None):
+    import argparse
+    from daa_engine import load_graph
+    parser = argparse.ArgumentParser(description="Build a contraction hierarchy for point-to-point queries.")
+    parser.add_argument("graph", help="edge list or binary graph file")
+    parser.add_argument("out", help=f"hierarchy file to write (*{EXTENSION})")
+    parser.add_argument("--upper", action="store_true", help="upper-case vertex labels like the GUI does")
+    parser.add_argument("--verify", type=int, default=20, metavar="SOURCES",
+                        help="check this many random sources against dijkstra (0 to skip)")
+    args = parser.parse_args(argv)
+
+    graph = load_graph(args.graph, upper=args.upper)
+    start = time.perf_counter()
+    ch = build_hierarchy(graph, lambda done, total: print(f"\rcontracted {done:,} / {total:,}", end="", file=sys.stderr))
+    print(f"\rbuilt {ch.num_edges:,} upward edges for {graph.num_edges:,} edges "
+          f"(core of {ch.core_size:,} vertices) in {time.perf_counter() - start:.1f} sec", file=sys.stderr)
+    save_hierarchy(ch, args.out)
+    if args.verify:
+        mean = verify(graph, load_hierarchy(args.out), sources=args.verify)
+        print(f"matches dijkstra; mean query {mean * 1e3:.3f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
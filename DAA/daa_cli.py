@@ -0,0 +1,94 @@
+import argparse
+import sys
+import time
+from daa_engine import ALGORITHMS, load_graph, shortest_distances, write_distances, find_negative_cycle
+from daa_query import shortest_path
+from daa_trace import RunStats
+from daa_ch import load_hierarchy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shortest paths without the GUI.")
+    parser.add_argument("--graph", required=True, help="edge list file (CSV / TSV / whitespace, optionally .gz)")
+    parser.add_argument("--source", required=True)
+    parser.add_argument("--target", help="answer a single source -> target query instead")
+    parser.add_argument("--algo", choices=list(ALGORITHMS), default="dijkstra")
+    parser.add_argument("--out", help="CSV file for the distances (default: stdout)")
+    parser.add_argument("--upper", action="store_true", help="upper-case vertex labels like the GUI does")
+    parser.add_argument("--ch", metavar="HIERARCHY", help="answer --target from a contraction hierarchy "
+                                                          "built by daa_ch.py for this graph")
+    parser.add_argument("--stats", action="store_true", help="print operation counts (dijkstra, bellman_ford)")
+    parser.add_argument("--trace", help="write the operation counts of the run to this JSON file")
+    args = parser.parse_args(argv)
+
+    source = args.source.upper() if args.upper else args.source
+    try:
+        graph = load_graph(args.graph, upper=args.upper)
+    except (OSError, ValueError) as e:
+        print(f"error: cannot load {args.graph}: {e}", file=sys.stderr)
+        return 2
+    if source not in graph:
+        print(f"error: start vertex {source!r} not found in graph", file=sys.stderr)
+        return 2
+
+    start_time = time.perf_counter()
+    if args.target:
+        target = args.target.upper() if args.upper else args.target
+        if target not in graph:
+            print(f"error: target vertex {target!r} not found in graph", file=sys.stderr)
+            return 2
+        if args.ch:
+            try:
+                hierarchy = load_hierarchy(args.ch)
+            except (OSError, ValueError) as e:
+                print(f"error: cannot load {args.ch}: {e}", file=sys.stderr)
+                return 2
+            if hierarchy.labels != list(graph.labels):
+                print(f"error: {args.ch} was built for a different graph", file=sys.stderr)
+                return 2
+            start_time = time.perf_counter()
+            distance, path = hierarchy.shortest_path(source, target)
+        else:
+            try:
+                distance, path = shortest_path(graph, source, target)
+            except ValueError as e:
+                print(f"error: {e}", file=sys.stderr)
+                return 1
+        print(f"{distance}\t{' '.join(path)}")
+    else:
+        stats = RunStats(args.algo, source) if args.stats or args.trace else None
+        try:
+            distances = shortest_distances(graph, source, args.algo, stats=stats)
+        except ValueError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+        if stats is not None:
+            stats.elapsed = time.perf_counter() - start_time
+            if args.stats:
+                print(f"{args.algo}: {stats.format()}", file=sys.stderr)
+            if args.trace:
+                try:
+                    stats.write_json(args.trace)
+                except OSError as e:
+                    print(f"error: cannot write {args.trace}: {e}", file=sys.stderr)
+                    return 2
+        if distances is None:
+            cycle = find_negative_cycle(graph, source)
+            print(f"error: graph contains a negative weight cycle: {' -> '.join(cycle)}", file=sys.stderr)
+            return 1
+        if args.out:
+            try:
+                write_distances(args.out, distances)
+            except (OSError, RuntimeError) as e:
+                print(f"error: cannot write {args.out}: {e}", file=sys.stderr)
+                return 2
+        else:
+            for vertex, distance in distances.items():
+                print(f"{vertex},{distance}")
+    print(f"{args.algo if not args.target else 'query'} finished in {time.perf_counter() - start_time:.6f} sec",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
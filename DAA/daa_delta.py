@@ -0,0 +1,160 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from daa_vectorized import edge_arrays, to_distance_list
+from daa_parallel import share_array
+
+# Delta-stepping (Meyer & Sanders): vertices are bucketed by tentative
+# distance in steps of delta and a whole bucket is relaxed at once, so each
+# phase is a batch of independent edge relaxations instead of one heap pop.
+# Light edges (w <= delta) are re-relaxed until the bucket is stable, heavy
+# edges once when it is done. Batches are relaxed with NumPy and, above
+# PARALLEL_MIN_EDGES, split across worker processes that read the CSR arrays
+# and the distance array from shared memory.
+
+PARALLEL_MIN_EDGES = 1 << 16
+
+
+# ---------------- Delta ---------------- #
+
+def auto_delta(graph):
+    # Meyer & Sanders' Θ(max weight / average degree): larger buckets give
+    # bigger batches, smaller ones fewer re-relaxations.
+    _, _, w = edge_arrays(graph)
+    if not len(w) or w.max() <= 0:
+        return 1.0
+    degree = max(1.0, graph.num_edges / max(graph.num_vertices, 1))
+    delta = float(w.max()) / degree
+    positive = w[w > 0]
+    return max(delta, float(positive.min()))
+
+
+def light_first(graph, delta):
+    # CSR arrays with each vertex's light edges ahead of its heavy ones, and
+    # light_end[u] marking the split.
+    src, dst, w = edge_arrays(graph)
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    heavy = w > delta
+    order = np.lexsort((heavy, src))
+    light_end = offsets[:-1] + np.bincount(src[~heavy], minlength=graph.num_vertices)
+    return offsets, light_end, dst[order], w[order]
+
+
+# ---------------- Batch Relaxation ---------------- #
+
+def relax(frontier, starts, ends, targets, weights, distance):
+    # Best candidate distance per target over the edges [starts[u], ends[u])
+    # of every frontier vertex. Returns (targets, distances), one row per target.
+    lo, hi = starts[frontier], ends[frontier]
+    counts = hi - lo
+    total = int(counts.sum())
+    if not total:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    edges = np.repeat(lo - np.cumsum(counts) + counts, counts) + np.arange(total)
+    candidate = np.repeat(distance[frontier], counts) + weights[edges]
+    reached = targets[edges]
+    return best_per_target(reached, candidate)
+
+
+def best_per_target(reached, candidate):
+    order = np.lexsort((candidate, reached))
+    reached, candidate = reached[order], candidate[order]
+    first = np.flatnonzero(np.r_[True, reached[1:] != reached[:-1]])
+    return reached[first], candidate[first]
+
+
+_worker = {}
+
+
+def _init_worker(names, n, m):
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    offsets, light_end, targets, weights, distance = blocks
+    _worker["blocks"] = blocks
+    _worker["offsets"] = np.ndarray(n + 1, dtype=np.int64, buffer=offsets.buf)
+    _worker["light_end"] = np.ndarray(n, dtype=np.int64, buffer=light_end.buf)
+    _worker["targets"] = np.ndarray(m, dtype=np.int64, buffer=targets.buf)
+    _worker["weights"] = np.ndarray(m, dtype=np.float64, buffer=weights.buf)
+    _worker["distance"] = np.ndarray(n, dtype=np.float64, buffer=distance.buf)
+
+
+def _relax_chunk(args):
+    frontier, heavy = args
+    offsets, light_end = _worker["offsets"], _worker["light_end"]
+    starts, ends = (light_end, offsets[1:]) if heavy else (offsets[:-1], light_end)
+    return relax(frontier, starts, ends, _worker["targets"], _worker["weights"], _worker["distance"])
+
+
+# ---------------- Delta-Stepping ---------------- #
+
+def delta_stepping(graph, source, delta=None, workers=1, progress=None):
+    # Returns a float64 distance array, inf where unreachable. Edge weights
+    # must be non-negative. progress(settled, num_vertices) runs per bucket.
+    n, m = graph.num_vertices, graph.num_edges
+    delta = delta or auto_delta(graph)
+    offsets, light_end, targets, weights = light_first(graph, delta)
+    if m and weights.min() < 0:
+        raise ValueError("Delta-stepping needs non-negative edge weights.")
+    workers = workers or os.cpu_count() or 1
+
+    blocks, pool = [], None
+    if workers > 1 and m >= PARALLEL_MIN_EDGES:
+        blocks = [share_array(offsets, np.int64), share_array(light_end, np.int64),
+                  share_array(targets, np.int64), share_array(weights, np.float64),
+                  share_array(np.full(n, np.inf), np.float64)]
+        distance = np.ndarray(n, dtype=np.float64, buffer=blocks[-1].buf)
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=([b.name for b in blocks], n, m))
+    else:
+        distance = np.full(n, np.inf)
+
+    def batch(frontier, heavy):
+        starts, ends = (light_end, offsets[1:]) if heavy else (offsets[:-1], light_end)
+        if pool is None or int((ends[frontier] - starts[frontier]).sum()) < PARALLEL_MIN_EDGES:
+            reached, candidate = relax(frontier, starts, ends, targets, weights, distance)
+        else:
+            parts = list(pool.map(_relax_chunk, [(chunk, heavy) for chunk in np.array_split(frontier, workers)]))
+            # Several workers can report the same target; keep the smallest.
+            reached, candidate = best_per_target(np.concatenate([p[0] for p in parts]),
+                                                 np.concatenate([p[1] for p in parts]))
+        better = candidate < distance[reached]
+        reached = reached[better]
+        distance[reached] = candidate[better]
+        return reached
+
+    try:
+        distance[source] = 0
+        pending = np.zeros(n, dtype=bool)
+        pending[source] = True
+        settled = 0
+        while True:
+            waiting = np.flatnonzero(pending)
+            if not len(waiting):
+                break
+            bound = (np.floor(distance[waiting].min() / delta) + 1) * delta
+            frontier = waiting[distance[waiting] < bound]
+            bucket = []
+            while len(frontier):
+                pending[frontier] = False
+                bucket.append(frontier)
+                improved = batch(frontier, heavy=False)
+                pending[improved] = True
+                frontier = improved[distance[improved] < bound]
+            bucket = np.unique(np.concatenate(bucket))
+            pending[batch(bucket, heavy=True)] = True
+            if progress is not None:
+                settled += len(bucket)
+                progress(min(settled, n), n)
+        return distance.copy()
+    finally:
+        distance = None  # drop the view so the shared block can be closed
+        if pool is not None:
+            pool.shutdown()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def delta_stepping_distances(csr, source, progress=None, workers=None):
+    # Engine signature for daa_engine; uses every core by default.
+    return to_distance_list(csr, delta_stepping(csr, source, workers=workers, progress=progress))
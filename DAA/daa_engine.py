@@ -0,0 +1,120 @@
+from daa_graph import CSRGraph
+from daa_buckets import bucket_dijkstra, dial_weight_bound
+from daa_spfa import spfa_distances, negative_cycle
+import daa_delta
+from daa_vectorized import bellman_ford_vectorized, to_distance_list
+from daa_import import import_edge_list
+from daa_store import is_binary_graph, load_binary
+from daa_results import ResultTable
+from daa_trace import counted_dijkstra, counted_dial_dijkstra
+
+# Headless shortest-path API: no Tk, networkx or matplotlib imports, and
+# failures come back as return values or exceptions, never dialogs.
+
+
+# ---------------- Graphs ---------------- #
+# The dict of (neighbor, weight) lists is only the build-time front end;
+# every algorithm runs on the interned CSR form from daa_graph.
+
+def as_csr(graph):
+    if isinstance(graph, CSRGraph):
+        return graph
+    return CSRGraph.from_dict(graph)
+
+
+def load_graph(path, upper=False, progress=None):
+    # Binary graph files are memory-mapped; anything else is parsed as an edge list.
+    if is_binary_graph(path):
+        return load_binary(path)
+    graph, _ = import_edge_list(path, upper=upper, progress=progress)
+    return graph
+
+
+# ---------------- Algorithms ---------------- #
+
+def dijkstra(graph, start, progress=None, stats=None):
+    # Uses Dial's buckets automatically for small non-negative integer weights.
+    # With a RunStats a counted copy of the same engine runs instead.
+    csr = as_csr(graph)
+    return csr.label_map(dijkstra_distances(csr, csr.index[start], progress, stats))
+
+
+def bellman_ford(graph, vertices, start, progress=None, stats=None):
+    # Returns None if a negative weight cycle is reachable from start.
+    csr = as_csr(graph)
+    distance, _ = bellman_ford_vectorized(csr, csr.index[start], max_passes=vertices - 1,
+                                          progress=progress, stats=stats)
+    if distance is None:
+        return None
+    return csr.label_map(to_distance_list(csr, distance))
+
+
+def delta_stepping(graph, start, progress=None, delta=None, workers=None):
+    # Non-negative weights only; delta defaults to daa_delta.auto_delta and
+    # workers to every core.
+    csr = as_csr(graph)
+    distance = daa_delta.delta_stepping(csr, csr.index[start], delta, workers, progress)
+    return csr.label_map(to_distance_list(csr, distance))
+
+
+def dijkstra_distances(csr, source, progress=None, stats=None):
+    if csr.num_edges and csr.weight_range[0] < 0:
+        raise ValueError("Dijkstra needs non-negative weights; use bellman_ford or spfa instead.")
+    if stats is None:
+        return bucket_dijkstra(csr, source, progress)
+    max_weight = dial_weight_bound(csr)
+    if max_weight is not None:
+        return counted_dial_dijkstra(csr, source, max_weight, stats, progress)
+    return counted_dijkstra(csr, source, stats, progress)
+
+
+def bellman_ford_distances(csr, source, progress=None, stats=None):
+    distance, _ = bellman_ford_vectorized(csr, source, progress=progress, stats=stats)
+    return None if distance is None else to_distance_list(csr, distance)
+
+
+# Every engine takes (csr, source id, progress) and returns a distance list
+# indexed by vertex id, or None on a reachable negative cycle.
+ALGORITHMS = {
+    "dijkstra": dijkstra_distances,
+    "bellman_ford": bellman_ford_distances,
+    "spfa": spfa_distances,
+    "delta_stepping": daa_delta.delta_stepping_distances,
+}
+
+# Engines that also accept a daa_trace.RunStats as a fourth argument.
+INSTRUMENTED = {
+    "dijkstra": dijkstra_distances,
+    "bellman_ford": bellman_ford_distances,
+}
+
+
+def find_negative_cycle(graph, start):
+    # Labels of a negative cycle reachable from start, first vertex repeated
+    # at the end, or None if there is none.
+    csr = as_csr(graph)
+    return negative_cycle(csr, csr.index[start])
+
+
+def shortest_distances(graph, start, algorithm="dijkstra", progress=None, stats=None):
+    # Label-level entry point for any registered engine; stats, if given,
+    # collects operation counts and needs an INSTRUMENTED engine.
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if stats is not None and algorithm not in INSTRUMENTED:
+        raise ValueError(f"{algorithm} does not support instrumentation")
+    csr = as_csr(graph)
+    if start not in csr:
+        raise KeyError(f"Start vertex {start!r} not found in graph")
+    if stats is None:
+        distance = ALGORITHMS[algorithm](csr, csr.index[start], progress)
+    else:
+        distance = INSTRUMENTED[algorithm](csr, csr.index[start], progress, stats)
+    return None if distance is None else csr.label_map(distance)
+
+
+# ---------------- Output ---------------- #
+
+def write_distances(path, distances):
+    # Streams a distance map to CSV, or to Parquet for *.parquet paths.
+    ResultTable.from_map(distances).export(path)
@@ -0,0 +1,175 @@
+from array import array
+import numpy as np
+from daa_graph import CSRGraph
+from daa_store import save_binary
+
+
+# ---------------- Helpers ---------------- #
+
+def to_csr(n, src, dst, w, labels=None):
+    # Builds a CSRGraph from NumPy edge arrays without per-edge Python objects.
+    # Edges already grouped by source (as the generators below emit them)
+    # skip the sort, which dominates at 10^7 edges.
+    counts = np.bincount(src, minlength=n)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    integer = np.issubdtype(w.dtype, np.integer)
+    if len(src) and np.any(src[1:] < src[:-1]):
+        order = np.argsort(src, kind="stable")
+        dst, w = dst[order], w[order]
+    return CSRGraph(
+        labels if labels is not None else [str(i) for i in range(n)],
+        array('q', offsets.tobytes()),
+        array('i', dst.astype(np.int32).tobytes()),
+        array('q' if integer else 'd', w.astype(np.int64 if integer else np.float64).tobytes()),
+    )
+
+
+def sources(counts):
+    # Source column for out-degree counts, already grouped by source.
+    return np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+
+
+def with_potentials(src, dst, w, n, rng, spread):
+    # Reweights w(u, v) -> w + p(u) - p(v). Every cycle keeps its original
+    # (non-negative) length, so this adds negative edges but no negative cycle.
+    p = rng.integers(0, spread + 1, size=n)
+    return w + p[src] - p[dst]
+
+
+def finish(n, src, dst, rng, max_weight, negative):
+    w = rng.integers(1, max_weight + 1, size=len(src))
+    if negative:
+        w = with_potentials(src, dst, w, n, rng, max_weight)
+    return to_csr(n, src, dst, w)
+
+
+# ---------------- Generators ---------------- #
+# All generators are seeded and return a CSRGraph with labels "0".."n-1".
+
+def random_sparse(n, avg_degree=4, seed=0, max_weight=100, negative=False):
+    # n * avg_degree edges with uniformly random endpoints (G(n, m)).
+    rng = np.random.default_rng(seed)
+    m = n * avg_degree
+    src = sources(np.bincount(rng.integers(0, n, size=m), minlength=n))
+    dst = rng.integers(0, n, size=m)
+    return finish(n, src, dst, rng, max_weight, negative)
+
+
+def erdos_renyi(n, p, seed=0, max_weight=100, negative=False):
+    # G(n, p) without self-loops: out-degrees are Binomial(n - 1, p) and each
+    # target is uniform over the other vertices. Targets are not deduplicated,
+    # so parallel edges appear with probability about p / 2 per edge.
+    rng = np.random.default_rng(seed)
+    src = sources(rng.binomial(n - 1, p, size=n))
+    dst = rng.integers(0, max(n - 1, 1), size=len(src))
+    dst += dst >= src
+    return finish(n, src, dst, rng, max_weight, negative)
+
+
+def grid(side, seed=0, max_weight=100, negative=False):
+    # Road-like side x side lattice with edges in both directions.
+    rng = np.random.default_rng(seed)
+    ids = np.arange(side * side).reshape(side, side)
+    right = (ids[:, :-1].ravel(), ids[:, 1:].ravel())
+    down = (ids[:-1, :].ravel(), ids[1:, :].ravel())
+    src = np.concatenate([right[0], right[1], down[0], down[1]])
+    dst = np.concatenate([right[1], right[0], down[1], down[0]])
+    return finish(side * side, src, dst, rng, max_weight, negative)
+
+
+def scale_free(n, attach=3, seed=0, max_weight=100, negative=False):
+    # Barabasi-Albert preferential attachment: each new vertex links to
+    # `attach` endpoints drawn from the list of all previous edge endpoints.
+    # That list grows by a fixed 2 * attach per vertex, so every draw is a
+    # position known up front; a position holding an earlier draw is
+    # resolved by following it back, all in vectorized rounds.
+    rng = np.random.default_rng(seed)
+    attach = max(1, min(attach, n - 1))
+    new = np.repeat(np.arange(attach, n, dtype=np.int64), attach)
+    filled = attach + 2 * attach * (new - attach)
+    position = (rng.random(len(new)) * filled).astype(np.int64)
+    picks = np.full(len(new), -1, dtype=np.int64)
+    pending = np.arange(len(new))
+    while len(pending):
+        at = position[pending]
+        offset = at - attach
+        block, slot = offset // (2 * attach), offset % (2 * attach)
+        initial = at < attach
+        picks[pending[initial]] = at[initial]
+        owner = ~initial & (slot >= attach)
+        picks[pending[owner]] = attach + block[owner]
+        # Slot < attach holds draw number block * attach + slot; follow it.
+        follow = ~initial & ~owner
+        position[pending[follow]] = position[block[follow] * attach + slot[follow]]
+        pending = pending[follow]
+    both_src = np.concatenate([new, picks])
+    both_dst = np.concatenate([picks, new])
+    return finish(n, both_src, both_dst, rng, max_weight, negative)
+
+
+def dag(n, avg_degree=4, seed=0, max_weight=100):
+    # Random DAG with weights in [-max_weight, max_weight]: negative edges but
+    # no cycles. Edges point forward in a hidden random topological order.
+    rng = np.random.default_rng(seed)
+    rank = rng.permutation(n)  # vertex -> topological position
+    vertex = np.argsort(rank)  # topological position -> vertex
+    # Out-degree grows with the room left after a vertex, so the average holds.
+    room = n - 1 - rank
+    counts = rng.binomial(room, min(1.0, 2 * avg_degree / max(n - 1, 1)))
+    src = sources(counts)
+    dst = vertex[rank[src] + 1 + (rng.random(len(src)) * room[src]).astype(np.int64)]
+    w = rng.integers(-max_weight, max_weight + 1, size=len(src))
+    return to_csr(n, src, dst, w)
+
+
+def planted_negative_cycle(n, avg_degree=4, length=8, seed=0, max_weight=100):
+    # random_sparse with negative edges but no negative cycle, plus one
+    # planted cycle through `length` random vertices with total weight -1.
+    rng = np.random.default_rng(seed)
+    m = n * avg_degree
+    src = sources(np.bincount(rng.integers(0, n, size=m), minlength=n))
+    dst = rng.integers(0, n, size=m)
+    w = with_potentials(src, dst, rng.integers(1, max_weight + 1, size=m), n, rng, max_weight)
+
+    length = max(1, min(length, n))
+    cycle = rng.choice(n, size=length, replace=False)
+    cycle_src, cycle_dst = cycle, np.roll(cycle, -1)
+    cycle_w = np.ones(length, dtype=np.int64)
+    cycle_w[-1] = -length
+    # Insert in source order so the edge arrays stay grouped.
+    order = np.argsort(cycle_src)
+    at = np.searchsorted(src, cycle_src[order], side="right")
+    src = np.insert(src, at, cycle_src[order])
+    dst = np.insert(dst, at, cycle_dst[order])
+    w = np.insert(w, at, cycle_w[order])
+    return to_csr(n, src, dst, w)
+
+
+def dense(n, density=0.5, seed=0, max_weight=100, negative=False):
+    rng = np.random.default_rng(seed)
+    mask = rng.random((n, n)) < density
+    np.fill_diagonal(mask, False)
+    src, dst = np.nonzero(mask)
+    return finish(n, src, dst, rng, max_weight, negative)
+
+
+# ---------------- Sized Generators ---------------- #
+# Each takes a target edge count and a seed, like the benchmark shapes.
+
+GENERATORS = {
+    "Erdős–Rényi": lambda m, seed: erdos_renyi(max(2, m // 4), 4 / max(1, m // 4 - 1), seed=seed),
+    "Grid / road": lambda m, seed: grid(max(2, int((m / 4) ** 0.5)), seed=seed),
+    "Barabási–Albert": lambda m, seed: scale_free(max(4, m // 6), seed=seed),
+    "DAG (negative weights)": lambda m, seed: dag(max(2, m // 4), seed=seed),
+    "Negative cycle": lambda m, seed: planted_negative_cycle(max(2, m // 4), seed=seed),
+}
+
+
+def generate(name, edges, seed=0, path=None):
+    # Builds the graph straight into CSR form; with a path it is also written
+    # as a binary graph file that load_graph can memory-map.
+    graph = GENERATORS[name](edges, seed)
+    if path is not None:
+        save_binary(graph, path)
+    return graph
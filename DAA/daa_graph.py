@@ -0,0 +1,176 @@
+from array import array
+import heapq
+
+INF = float('inf')
+
+
+# ---------------- Compact Graph (CSR) ---------------- #
+
+class CSRGraph:
+    # Vertex labels are interned to dense ints 0..n-1. The out-edges of
+    # vertex u are targets[offsets[u]:offsets[u + 1]] with matching weights.
+    # The arrays may be array.array objects or typed memoryviews (e.g. over
+    # a memory-mapped file or shared memory).
+    def __init__(self, labels, offsets, targets, weights):
+        self.labels = labels
+        self._index = None
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._reverse = None
+        self._weight_range = None
+
+    @property
+    def num_vertices(self):
+        return len(self.labels)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    @property
+    def index(self):
+        # Label -> vertex id, built on first use.
+        if self._index is None:
+            self._index = {label: i for i, label in enumerate(self.labels)}
+        return self._index
+
+    @property
+    def integer_weights(self):
+        return getattr(self.weights, 'typecode', None) == 'q' or getattr(self.weights, 'format', None) == 'q'
+
+    @property
+    def weight_range(self):
+        # (min, max) edge weight, computed once.
+        if self._weight_range is None:
+            self._weight_range = (min(self.weights, default=0), max(self.weights, default=0))
+        return self._weight_range
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.index
+
+    def neighbors(self, label):
+        u = self.index[label]
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        return [(self.labels[self.targets[i]], self.weights[i]) for i in range(lo, hi)]
+
+    def edges(self):
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for u in range(len(self.labels)):
+            for i in range(offsets[u], offsets[u + 1]):
+                yield u, targets[i], weights[i]
+
+    def to_dict(self):
+        return {label: self.neighbors(label) for label in self.labels}
+
+    def reverse(self):
+        # Transposed graph (every edge flipped), built once and cached.
+        if self._reverse is None:
+            offsets = self.offsets
+            sources = array('i')
+            for u in range(len(self.labels)):
+                sources.extend(array('i', [u]) * (offsets[u + 1] - offsets[u]))
+            self._reverse = CSRGraph.from_edge_arrays(self.labels, self.targets, sources, self.weights)
+            self._reverse._reverse = self
+        return self._reverse
+
+    def label_map(self, values):
+        return dict(zip(self.labels, values))
+
+    # ---- Builders ---- #
+    @classmethod
+    def from_edge_arrays(cls, labels, sources, targets, weights):
+        # Counting sort of the edge list by source vertex.
+        n = len(labels)
+        counts = [0] * (n + 1)
+        for u in sources:
+            counts[u + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        offsets = array('q', counts)
+
+        typecode = 'q' if all(float(w).is_integer() for w in weights) else 'd'
+        out_targets = array('i', bytes(4 * len(sources)))
+        out_weights = array(typecode, bytes(8 * len(sources)))
+        cursor = counts[:-1]
+        for u, v, w in zip(sources, targets, weights):
+            pos = cursor[u]
+            out_targets[pos] = v
+            out_weights[pos] = int(w) if typecode == 'q' else w
+            cursor[u] = pos + 1
+        return cls(list(labels), offsets, out_targets, out_weights)
+
+    @classmethod
+    def from_dict(cls, graph):
+        labels = list(graph)
+        index = {label: i for i, label in enumerate(labels)}
+        sources, targets, weights = array('i'), array('i'), []
+        for u, edges in graph.items():
+            ui = index[u]
+            for v, w in edges:
+                if v not in index:
+                    index[v] = len(labels)
+                    labels.append(v)
+                sources.append(ui)
+                targets.append(index[v])
+                weights.append(w)
+        return cls.from_edge_arrays(labels, sources, targets, weights)
+
+
+# ---------------- Algorithms on CSR ---------------- #
+
+def dijkstra_csr(graph, source, progress=None, every=4096):
+    # progress(settled, num_vertices), if given, is called every `every` settled vertices.
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = [INF] * graph.num_vertices
+    distances[source] = 0
+    pq = [(0, source)]
+    settled = 0
+
+    while pq:
+        current_distance, u = heapq.heappop(pq)
+        if current_distance > distances[u]:
+            continue
+        if progress is not None:
+            settled += 1
+            if settled % every == 0:
+                progress(settled, len(distances))
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            distance = current_distance + weights[i]
+            if distance < distances[v]:
+                distances[v] = distance
+                heapq.heappush(pq, (distance, v))
+    return distances
+
+
+def bellman_ford_csr(graph, source, passes=None):
+    # Returns None when a negative weight cycle is reachable from source.
+    n = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distance = [INF] * n
+    distance[source] = 0
+    if passes is None:
+        passes = n - 1
+
+    for _ in range(passes):
+        for u in range(n):
+            du = distance[u]
+            if du == INF:
+                continue
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if du + weights[i] < distance[v]:
+                    distance[v] = du + weights[i]
+
+    for u in range(n):
+        du = distance[u]
+        if du == INF:
+            continue
+        for i in range(offsets[u], offsets[u + 1]):
+            if du + weights[i] < distance[targets[i]]:
+                return None
+    return distance
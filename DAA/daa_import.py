@@ -0,0 +1,133 @@
+import csv
+import gzip
+import io
+import os
+import sys
+import time
+from array import array
+from itertools import islice
+from daa_graph import CSRGraph
+
+
+# ---------------- Helpers ---------------- #
+
+def open_edge_file(path):
+    # Returns (text stream, raw binary file); the raw file's position drives
+    # progress. Close both: GzipFile doesn't close the file it wraps.
+    raw = open(path, "rb")
+    magic = raw.peek(2)[:2]
+    stream = gzip.GzipFile(fileobj=raw) if magic == b"\x1f\x8b" else raw
+    return io.TextIOWrapper(stream, encoding="utf-8", newline=""), raw
+
+
+def guess_delimiter(path):
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".csv"):
+        return ","
+    if name.endswith(".tsv"):
+        return "\t"
+    return None
+
+
+def parse_weight(token):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def is_header(row):
+    if row[0].strip().lower() in ("from", "source", "src", "u"):
+        return True
+    if len(row) > 2:
+        try:
+            parse_weight(row[2])
+        except ValueError:
+            return True
+    return False
+
+
+def edge_rows(text, delimiter):
+    # Yields token lists, skipping blank and comment lines.
+    if delimiter is None:
+        rows = (line.split() for line in text)
+    else:
+        rows = csv.reader(text, delimiter=delimiter)
+    for row in rows:
+        if row and row[0] and row[0][0] not in "#%":
+            yield row
+
+
+# ---------------- Streaming Import ---------------- #
+
+def import_edge_list(path, delimiter=None, upper=False, default_weight=1,
+                     chunk_size=100_000, progress=None):
+    # Streams "from to [weight]" rows (CSV, TSV or whitespace separated,
+    # optionally gzip compressed) straight into typed arrays and builds a
+    # CSRGraph. progress(edges_read, fraction_done) is called once per chunk.
+    # Returns (graph, stats) where stats reports edges/s.
+    if delimiter is None:
+        delimiter = guess_delimiter(path)
+    total_bytes = os.path.getsize(path) or 1
+
+    labels, index = [], {}
+    sources, targets, weights = array("i"), array("i"), []
+    lookup, add_source, add_target, add_weight = index.get, sources.append, targets.append, weights.append
+    start_time = time.perf_counter()
+
+    text, raw = open_edge_file(path)
+    with raw, text:
+        rows = edge_rows(text, delimiter)
+        header_checked = False
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            if not header_checked:
+                header_checked = True
+                if is_header(chunk[0]):
+                    chunk = chunk[1:]
+            for row in chunk:
+                if len(row) < 2:
+                    raise ValueError(f"Malformed edge row: {row!r}")
+                u, v = row[0].strip(), row[1].strip()
+                if upper:
+                    u, v = u.upper(), v.upper()
+                ui = lookup(u)
+                if ui is None:
+                    ui = index[u] = len(labels)
+                    labels.append(u)
+                vi = lookup(v)
+                if vi is None:
+                    vi = index[v] = len(labels)
+                    labels.append(v)
+                add_source(ui)
+                add_target(vi)
+                add_weight(parse_weight(row[2]) if len(row) > 2 else default_weight)
+            if progress is not None:
+                progress(len(sources), min(raw.tell() / total_bytes, 1.0))
+
+    graph = CSRGraph.from_edge_arrays(labels, sources, targets, weights)
+    seconds = time.perf_counter() - start_time
+    stats = {
+        "edges": graph.num_edges,
+        "vertices": graph.num_vertices,
+        "seconds": seconds,
+        "edges_per_sec": graph.num_edges / seconds if seconds > 0 else float("inf"),
+    }
+    return graph, stats
+
+
+def format_stats(stats):
+    return (f"{stats['edges']:,} edges, {stats['vertices']:,} vertices in "
+            f"{stats['seconds']:.3f} sec ({stats['edges_per_sec']:,.0f} edges/s)")
+
+
+if __name__ == "__main__":
+    for edge_file in sys.argv[1:]:
+        _, result = import_edge_list(
+            edge_file, progress=lambda n, f: print(f"\r{f:6.1%}  {n:,} edges", end="", file=sys.stderr))
+        print(file=sys.stderr)
+        print(f"{edge_file}: {format_stats(result)}")
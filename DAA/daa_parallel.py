@@ -0,0 +1,123 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from daa_graph import CSRGraph, dijkstra_csr
+from daa_generators import to_csr
+from daa_vectorized import edge_arrays, bellman_ford_vectorized
+
+
+# ---------------- Johnson's Reweighting ---------------- #
+
+def johnson_potentials(graph):
+    # Bellman-Ford from a virtual vertex n with a 0-weight edge to every
+    # vertex. Raises ValueError if the graph has a negative weight cycle.
+    n = graph.num_vertices
+    src, dst, w = edge_arrays(graph)
+    extra = np.arange(n, dtype=np.int64)
+    augmented = to_csr(
+        n + 1,
+        np.concatenate([src, np.full(n, n, dtype=np.int64)]),
+        np.concatenate([dst, extra]),
+        np.concatenate([w, np.zeros(n)]),
+        labels=list(range(n + 1)),
+    )
+    potentials, _ = bellman_ford_vectorized(augmented, n)
+    if potentials is None:
+        raise ValueError("Graph contains a negative weight cycle!")
+    return potentials[:n]
+
+
+def reweighted(graph, potentials):
+    # Same graph with w'(u, v) = w + h(u) - h(v) >= 0.
+    src, dst, w = edge_arrays(graph)
+    return np.maximum(w + potentials[src] - potentials[dst], 0.0)
+
+
+# ---------------- Shared Memory ---------------- #
+
+def share_array(values, dtype):
+    values = np.asarray(values, dtype=dtype)
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=dtype, buffer=shm.buf)[:] = values
+    return shm
+
+
+_worker = {}
+
+
+def _init_worker(names, n, num_edges, num_sources):
+    # Attaches to the parent's read-only CSR blocks and the output matrix once per process.
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    offsets, targets, weights, potentials, out = blocks
+    _worker["blocks"] = blocks
+    _worker["graph"] = CSRGraph(
+        range(n),
+        offsets.buf.cast("q"),
+        targets.buf[:4 * num_edges].cast("i"),
+        weights.buf[:8 * num_edges].cast("d"),
+    )
+    _worker["potentials"] = np.ndarray(n, dtype=np.float64, buffer=potentials.buf)
+    _worker["out"] = np.ndarray((num_sources, n), dtype=np.float64, buffer=out.buf)
+
+
+def _run_rows(rows):
+    graph, h, out = _worker["graph"], _worker["potentials"], _worker["out"]
+    for row, source in rows:
+        distance = np.array(dijkstra_csr(graph, source))
+        out[row] = distance - h[source] + h
+    return len(rows)
+
+
+# ---------------- Multi-Source Dijkstra ---------------- #
+
+def multi_source_dijkstra(graph, sources, workers=None, batch=8):
+    # Returns a (len(sources), n) float64 distance matrix, inf where unreachable.
+    # Negative edges are handled with Johnson's reweighting.
+    n, m = graph.num_vertices, graph.num_edges
+    sources = list(sources)
+    workers = workers or os.cpu_count() or 1
+
+    _, _, w = edge_arrays(graph)
+    if m and w.min() < 0:
+        potentials = johnson_potentials(graph)
+        weights = reweighted(graph, potentials)
+    else:
+        potentials = np.zeros(n)
+        weights = w
+
+    if workers == 1 or len(sources) < 2:
+        local = CSRGraph(range(n), graph.offsets, graph.targets, weights.tolist())
+        out = np.empty((len(sources), n))
+        for row, source in enumerate(sources):
+            out[row] = np.array(dijkstra_csr(local, source)) - potentials[source] + potentials
+        return out
+
+    blocks = [
+        share_array(np.frombuffer(graph.offsets, dtype=np.int64), np.int64),
+        share_array(np.frombuffer(graph.targets, dtype=np.int32), np.int32),
+        share_array(weights, np.float64),
+        share_array(potentials, np.float64),
+        shared_memory.SharedMemory(create=True, size=max(8 * len(sources) * n, 1)),
+    ]
+    try:
+        jobs = list(enumerate(sources))
+        chunks = [jobs[i:i + batch] for i in range(0, len(jobs), batch)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=([b.name for b in blocks], n, m, len(sources))) as pool:
+            for _ in pool.map(_run_rows, chunks):
+                pass
+        return np.ndarray((len(sources), n), dtype=np.float64, buffer=blocks[-1].buf).copy()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def all_pairs_dijkstra(graph, workers=None):
+    return multi_source_dijkstra(graph, range(graph.num_vertices), workers)
+
+
+def distance_rows(graph, sources, matrix):
+    # Label-level view of a distance matrix, mainly for small graphs and printing.
+    return {graph.labels[s]: graph.label_map(row.tolist()) for s, row in zip(sources, matrix)}
@@ -1,46 +1,29 @@
 import tkinter as tk
-from tkinter import messagebox
-import heapq
+from tkinter import messagebox, filedialog, ttk
+import struct
 import time
-import networkx as nx
-import matplotlib.pyplot as plt
-
-# ---------------- Algorithms ---------------- #
-
-def dijkstra(graph, start):
-    distances = {node: float('inf') for node in graph}
-    distances[start] = 0
-    pq = [(0, start)]
-
-    while pq:
-        current_distance, current_node = heapq.heappop(pq)
-        if current_distance > distances[current_node]:
-            continue
-        for neighbor, weight in graph[current_node]:
-            distance = current_distance + weight
-            if distance < distances[neighbor]:
-                distances[neighbor] = distance
-                heapq.heappush(pq, (distance, neighbor))
-    return distances
-
-
-def bellman_ford(graph, vertices, start):
-    distance = {node: float('inf') for node in graph}
-    distance[start] = 0
-
-    for _ in range(vertices - 1):
-        for u in graph:
-            for v, w in graph[u]:
-                if distance[u] + w < distance[v]:
-                    distance[v] = distance[u] + w
-
-    for u in graph:
-        for v, w in graph[u]:
-            if distance[u] + w < distance[v]:
-                messagebox.showerror("Error", "Graph contains a negative weight cycle!")
-                return None
-    return distance
-
+import numpy as np
+from daa_graph import CSRGraph
+from daa_engine import dijkstra, bellman_ford, delta_stepping, find_negative_cycle
+from daa_import import import_edge_list, format_stats
+from daa_store import EXTENSION, load_binary, save_binary
+from daa_query import shortest_path
+from daa_cache import ResultCache
+from daa_worker import BackgroundRun, RunCancelled
+from daa_render import LARGE_GRAPH, VIEWS, fast_layout, draw_large, draw_matrix
+from daa_results import ResultTable, format_distance
+from daa_result_view import ResultWindow
+from daa_trace import RunStats
+from daa_replay import RECORDERS, Replay
+from daa_generators import GENERATORS, generate
+from daa_floyd import FLOYD_MAX_VERTICES, floyd_warshall, matrix_path
+from daa_ch import EXTENSION as CH_EXTENSION, build_hierarchy, save_hierarchy
+
+# Algorithms live in the headless daa_engine module; networkx and matplotlib
+# are only imported when a graph is actually drawn.
+
+MAX_LOG_LINES = 500
+INLINE_RESULT_LIMIT = 50
 
 # ---------------- GUI ---------------- #
 
@@ -48,10 +31,19 @@ class GraphGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("🚀 Shortest Path Visualizer")
-        self.root.geometry("720x580")
+        self.root.geometry("720x720")
         self.root.configure(bg="#0b132b")
 
         self.graph = {}
+        self.csr = None
+        self.version = 0
+        self.results = ResultCache()
+        self.active_run = None
+        self.layout_key = None
+        self.layout = None
+        self.result_window = ResultWindow(root)
+        self.trace_dir = None
+        self.hierarchy = None
 
         # ---- Title ---- #
         tk.Label(root, text="Shortest Path Visualizer", font=("Poppins", 22, "bold"),
@@ -77,10 +69,42 @@ class GraphGUI:
 
         self.create_button(input_frame, "Add Edge", "#06d6a0", self.add_edge, 6, 0, 20)
 
-        # ---- Start Node ---- #
-        tk.Label(root, text="Start Vertex:", font=("Poppins", 12), fg="#ffffff", bg="#0b132b").pack(pady=(15, 2))
-        self.entry_start = tk.Entry(root, width=8, font=("Poppins", 12), bg="#3a506b", fg="white", bd=0, justify="center")
-        self.entry_start.pack()
+        # ---- Graph Files ---- #
+        file_frame = tk.Frame(root, bg="#0b132b")
+        file_frame.pack()
+        self.create_button(file_frame, "Import Edges", "#b8f2e6", self.import_edges, 0, 0)
+        self.create_button(file_frame, "Load Graph", "#b8f2e6", self.load_graph_file, 0, 1)
+        self.create_button(file_frame, "Save Graph", "#b8f2e6", self.save_graph_file, 0, 2)
+        self.create_button(file_frame, "Build Hierarchy", "#b8f2e6", self.build_hierarchy_file, 0, 3)
+
+        # ---- Generators ---- #
+        gen_frame = tk.Frame(root, bg="#1c2541", bd=2, relief="groove")
+        gen_frame.pack(pady=(5, 0))
+        self.generator_choice = tk.StringVar(value=next(iter(GENERATORS)))
+        gen_menu = tk.OptionMenu(gen_frame, self.generator_choice, *GENERATORS)
+        gen_menu.config(font=("Poppins", 10), bg="#3a506b", fg="white", activebackground="#3a506b",
+                        relief="flat", bd=0, highlightthickness=0, width=20)
+        gen_menu.grid(row=0, column=0, padx=5)
+        gen_entries = []
+        for i, (text, default) in enumerate([("Edges:", "100000"), ("Seed:", "0")]):
+            tk.Label(gen_frame, text=text, font=("Poppins", 11), fg="white", bg="#1c2541").grid(row=0, column=1 + i * 2, padx=5)
+            entry = tk.Entry(gen_frame, width=9, font=("Poppins", 11), bg="#3a506b", fg="white", bd=0, justify="center")
+            entry.insert(0, default)
+            entry.grid(row=0, column=2 + i * 2, padx=5)
+            gen_entries.append(entry)
+        self.entry_gen_edges, self.entry_gen_seed = gen_entries
+        self.create_button(gen_frame, "Generate", "#b8f2e6", lambda: self.generate_graph(False), 1, 0)
+        self.create_button(gen_frame, "Generate to File", "#b8f2e6", lambda: self.generate_graph(True), 1, 1, 8)
+
+        # ---- Start / Target Nodes ---- #
+        vertex_frame = tk.Frame(root, bg="#0b132b")
+        vertex_frame.pack(pady=(15, 2))
+        tk.Label(vertex_frame, text="Start Vertex:", font=("Poppins", 12), fg="#ffffff", bg="#0b132b").grid(row=0, column=0, padx=15)
+        tk.Label(vertex_frame, text="Target Vertex:", font=("Poppins", 12), fg="#ffffff", bg="#0b132b").grid(row=0, column=1, padx=15)
+        self.entry_start = tk.Entry(vertex_frame, width=8, font=("Poppins", 12), bg="#3a506b", fg="white", bd=0, justify="center")
+        self.entry_start.grid(row=1, column=0)
+        self.entry_target = tk.Entry(vertex_frame, width=8, font=("Poppins", 12), bg="#3a506b", fg="white", bd=0, justify="center")
+        self.entry_target.grid(row=1, column=1)
 
         # ---- Buttons ---- #
         button_frame = tk.Frame(root, bg="#0b132b")
@@ -89,6 +113,33 @@ class GraphGUI:
         self.create_button(button_frame, "Run Dijkstra", "#48cae4", self.run_dijkstra, 0, 0)
         self.create_button(button_frame, "Run Bellman-Ford", "#ffd166", self.run_bellman, 0, 1)
         self.create_button(button_frame, "Show Graph", "#ef476f", self.show_graph, 0, 2)
+        self.create_button(button_frame, "Run Δ-Stepping", "#90e0ef", self.run_delta, 2, 2)
+        self.create_button(button_frame, "All Pairs", "#f4a261", self.run_all_pairs, 3, 0)
+        self.view_choice = tk.StringVar(value="Full graph")
+        view_menu = tk.OptionMenu(button_frame, self.view_choice, *VIEWS)
+        view_menu.config(font=("Poppins", 10), bg="#1c2541", fg="white", activebackground="#3a506b",
+                         relief="flat", bd=0, highlightthickness=0, width=16)
+        view_menu.grid(row=1, column=2)
+        self.count_ops = tk.BooleanVar(value=False)
+        self.save_trace = tk.BooleanVar(value=False)
+        for col, (text, var, command) in enumerate([("Count operations", self.count_ops, None),
+                                                    ("Save JSON trace", self.save_trace, self.choose_trace_dir)]):
+            tk.Checkbutton(button_frame, text=text, variable=var, command=command, font=("Poppins", 10),
+                           fg="white", bg="#0b132b", selectcolor="#1c2541", activebackground="#0b132b",
+                           activeforeground="white").grid(row=1, column=col)
+        self.create_button(button_frame, "Replay", "#cdb4db", self.run_replay, 2, 0)
+        self.replay_choice = tk.StringVar(value="Dijkstra")
+        replay_menu = tk.OptionMenu(button_frame, self.replay_choice, *RECORDERS)
+        replay_menu.config(font=("Poppins", 10), bg="#1c2541", fg="white", activebackground="#3a506b",
+                           relief="flat", bd=0, highlightthickness=0, width=16)
+        replay_menu.grid(row=2, column=1)
+
+        # ---- Run Progress ---- #
+        run_frame = tk.Frame(root, bg="#0b132b")
+        run_frame.pack()
+        self.progress_bar = ttk.Progressbar(run_frame, length=360, mode="determinate", maximum=1.0)
+        self.progress_bar.grid(row=0, column=0, padx=8)
+        self.create_button(run_frame, "Cancel", "#adb5bd", self.cancel_run, 0, 1)
 
         # ---- Output ---- #
         self.output_text = tk.Text(root, height=10, width=75, wrap="word",
@@ -96,11 +147,23 @@ class GraphGUI:
                                    bd=0, relief="flat", padx=10, pady=10)
         self.output_text.pack(pady=20)
 
+        self.status_label = tk.Label(root, text="", font=("Poppins", 10), fg="#c0c0c0", bg="#0b132b")
+        self.status_label.pack()
+
         # Add scrollbar
         scroll = tk.Scrollbar(self.output_text, command=self.output_text.yview)
         self.output_text.configure(yscrollcommand=scroll.set)
         scroll.pack(side="right", fill="y")
 
+    # ---- Output Log ---- #
+    def log(self, text):
+        # Appends to the output box and drops the oldest lines past MAX_LOG_LINES.
+        self.output_text.insert(tk.END, text)
+        lines = int(self.output_text.index("end-1c").split(".")[0])
+        if lines > MAX_LOG_LINES:
+            self.output_text.delete("1.0", f"{lines - MAX_LOG_LINES + 1}.0")
+        self.output_text.see(tk.END)
+
     # ---- Helper for Buttons ---- #
     def create_button(self, frame, text, color, command, row, col, padx=8):
         btn = tk.Button(frame, text=text, command=command, font=("Poppins", 11, "bold"),
@@ -121,50 +184,417 @@ class GraphGUI:
             messagebox.showerror("Invalid Input", "Weight must be an integer!")
             return
 
+        if self.graph is None:
+            self.graph = self.csr.to_dict()
         if u not in self.graph:
             self.graph[u] = []
         if v not in self.graph:
             self.graph[v] = []
 
         self.graph[u].append((v, w))
-        self.output_text.insert(tk.END, f"✅ Added Edge: {u} → {v} (Weight {w})\n")
+        self.csr = None
+        self.version += 1
+        self.results.apply_edge(self.graph, u, v, w, self.version - 1, self.version)
+        self.log(f"✅ Added Edge: {u} → {v} (Weight {w})\n")
         self.entry_from.delete(0, tk.END)
         self.entry_to.delete(0, tk.END)
         self.entry_weight.delete(0, tk.END)
 
+    def import_edges(self):
+        path = filedialog.askopenfilename(
+            title="Import Edge List",
+            filetypes=[("Edge lists", "*.csv *.tsv *.txt *.edges *.gz"), ("All files", "*.*")])
+        if not path:
+            return
+
+        def task(report):
+            # Progress is reported in percent of the file read.
+            return import_edge_list(path, upper=True, progress=lambda edges, fraction: report(int(fraction * 100), 100))
+
+        def done(outcome):
+            csr, stats = outcome
+            self.set_csr(csr)
+            self.log(f"📥 Imported {format_stats(stats)}\n")
+
+        self.start_run("Importing edge list", task, done)
+
+    def load_graph_file(self):
+        path = filedialog.askopenfilename(
+            title="Load Graph", filetypes=[("Binary graphs", f"*{EXTENSION}"), ("All files", "*.*")])
+        if not path:
+            return
+        start_time = time.perf_counter()
+        try:
+            csr = load_binary(path)
+        except (OSError, ValueError, struct.error) as e:
+            messagebox.showerror("Load Failed", str(e))
+            return
+        self.set_csr(csr)
+        self.log(f"📂 Loaded {csr.num_vertices:,} vertices, {csr.num_edges:,} edges "
+                 f"in {time.perf_counter() - start_time:.6f} sec\n")
+
+    def save_graph_file(self):
+        csr = self.get_csr()
+        if not csr.num_vertices:
+            messagebox.showerror("Error", "No graph data available!")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save Graph", defaultextension=EXTENSION, filetypes=[("Binary graphs", f"*{EXTENSION}")])
+        if not path:
+            return
+        try:
+            save_binary(csr, path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Save Failed", str(e))
+            return
+        self.log(f"💾 Saved graph to {path}\n")
+
+    def generate_graph(self, to_file):
+        try:
+            edges = int(self.entry_gen_edges.get().replace(",", "").replace("_", ""))
+            seed = int(self.entry_gen_seed.get())
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Edges and seed must be integers!")
+            return
+        if edges < 1:
+            messagebox.showerror("Invalid Input", "Edges must be positive!")
+            return
+        path = None
+        if to_file:
+            path = filedialog.asksaveasfilename(
+                title="Generate to File", defaultextension=EXTENSION, filetypes=[("Binary graphs", f"*{EXTENSION}")])
+            if not path:
+                return
+        name = self.generator_choice.get()
+
+        def done(outcome):
+            csr, elapsed = outcome
+            self.set_csr(csr)
+            where = f" → {path}" if path else ""
+            self.log(f"🧪 Generated {name}: {csr.num_vertices:,} vertices, {csr.num_edges:,} edges "
+                     f"(seed {seed}) in {elapsed:.6f} sec{where}\n")
+
+        self.start_run(f"Generating {name}", lambda report: self.timed(lambda: generate(name, edges, seed, path)), done)
+
+    def build_hierarchy_file(self):
+        # Offline contraction-hierarchy preprocessing; later point-to-point
+        # queries on the same graph version use it instead of a search.
+        csr = self.get_csr()
+        if not csr.num_vertices:
+            messagebox.showerror("Error", "No graph data available!")
+            return
+        if csr.num_edges and csr.weight_range[0] < 0:
+            messagebox.showerror("Error", "Contraction hierarchies need non-negative weights!")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save Hierarchy", defaultextension=CH_EXTENSION, filetypes=[("Hierarchies", f"*{CH_EXTENSION}")])
+        if not path:
+            return
+        version = self.version
+
+        def task(report):
+            hierarchy, elapsed = self.timed(lambda: build_hierarchy(csr, report))
+            save_hierarchy(hierarchy, path)
+            return hierarchy, elapsed
+
+        def done(outcome):
+            hierarchy, elapsed = outcome
+            self.hierarchy = (version, hierarchy)
+            core = f", core of {hierarchy.core_size:,} vertices" if hierarchy.core_size else ""
+            self.log(f"🗺 Built hierarchy with {hierarchy.num_edges:,} upward edges{core} in {elapsed:.2f} sec → {path}\n")
+
+        self.start_run("Contracting", task, done)
+
+    def set_csr(self, csr):
+        # Imported and loaded graphs live only in CSR form; add_edge rebuilds the dict on demand.
+        self.graph, self.csr = None, csr
+        self.version += 1
+        self.results.clear()
+
+    def get_csr(self):
+        if self.csr is None:
+            self.csr = CSRGraph.from_dict(self.graph)
+        return self.csr
+
+    # ---- Background Runs ---- #
+    def start_run(self, title, task, on_done):
+        # task(report) runs on a worker thread; on_done(result) runs on the Tk thread.
+        if self.active_run is not None:
+            self.status_label.config(text="A run is already in progress.")
+            return
+        self.progress_bar["value"] = 0
+        self.status_label.config(text=f"{title}...")
+
+        def finished(result):
+            self.active_run = None
+            self.progress_bar["value"] = 1.0
+            self.status_label.config(text="")
+            on_done(result)
+
+        def failed(error):
+            self.active_run = None
+            self.progress_bar["value"] = 0
+            self.status_label.config(text="")
+            if isinstance(error, RunCancelled):
+                self.log(f"\n⛔ {title} cancelled\n")
+            else:
+                messagebox.showerror("Error", f"{title} failed: {error}")
+
+        def show_progress(done, total):
+            self.progress_bar["value"] = done / total if total else 0
+            self.status_label.config(text=f"{title}... {done:,} / {total:,}")
+
+        self.active_run = BackgroundRun(self.root, task, finished, show_progress, failed).start()
+
+    def cancel_run(self):
+        if self.active_run is not None:
+            self.active_run.cancel()
+            self.status_label.config(text="Cancelling...")
+
+    def timed(self, run):
+        start_time = time.perf_counter()
+        result = run()
+        return result, time.perf_counter() - start_time
+
+    # ---- Instrumentation ---- #
+    def choose_trace_dir(self):
+        if not self.save_trace.get():
+            return
+        path = filedialog.askdirectory(title="Folder for JSON Traces")
+        if path:
+            self.trace_dir = path
+        else:
+            self.save_trace.set(False)
+
+    def new_stats(self, algorithm, start):
+        # Counting (and tracing, which implies it) bypasses the result cache.
+        if self.count_ops.get() or self.save_trace.get():
+            return RunStats(algorithm, start)
+        return None
+
+    def report_stats(self, stats, elapsed):
+        if stats is None:
+            return
+        stats.elapsed = elapsed
+        self.log(f"🔢 Operations: {stats.format()}\n")
+        if self.save_trace.get() and self.trace_dir:
+            path = stats.trace_path(self.trace_dir)
+            try:
+                stats.write_json(path)
+            except OSError as e:
+                messagebox.showerror("Trace Failed", str(e))
+                return
+            self.log(f"🧾 Trace written to {path}\n")
+
+    # ---- Algorithms ---- #
     def run_dijkstra(self):
         start = self.entry_start.get().upper()
-        if start not in self.graph:
+        if start not in self.get_csr():
             messagebox.showerror("Error", "Start vertex not found in graph!")
             return
-        start_time = time.time()
-        result = dijkstra(self.graph, start)
-        end_time = time.time()
-        self.output_text.insert(tk.END, f"\n💠 Dijkstra Result from {start}: {result}\n")
-        self.output_text.insert(tk.END, f"⏱ Execution Time: {end_time - start_time:.6f} sec\n")
+        target = self.entry_target.get().upper()
+        if target:
+            self.run_query(start, target)
+            return
+        csr = self.get_csr()
+        if csr.num_edges and csr.weight_range[0] < 0:
+            messagebox.showerror("Error", "Dijkstra needs non-negative weights; use Bellman-Ford instead.")
+            return
+
+        version = self.version
+        stats = self.new_stats("dijkstra", start)
+        cached = self.results.get("dijkstra", start, version)
+        if cached is not None and stats is None:
+            self.show_dijkstra(start, cached, 0.0, True)
+            return
+
+        def done(outcome):
+            result, elapsed = outcome
+            self.results.put("dijkstra", start, version, result)
+            self.show_dijkstra(start, result, elapsed, False)
+            self.report_stats(stats, elapsed)
+
+        self.start_run("Dijkstra", lambda report: self.timed(lambda: dijkstra(csr, start, report, stats)), done)
+
+    def show_dijkstra(self, start, result, elapsed, cached):
+        self.show_result(f"💠 Dijkstra Result from {start}{' (cached)' if cached else ''}", result, elapsed)
+
+    def run_query(self, start, target):
+        csr = self.get_csr()
+        if target not in csr:
+            messagebox.showerror("Error", "Target vertex not found in graph!")
+            return
+        # A hierarchy built for this graph version answers the query; either
+        # way it runs on the worker thread, since a core search is not instant.
+        hierarchy = self.hierarchy[1] if self.hierarchy is not None and self.hierarchy[0] == self.version else None
+        if hierarchy is not None:
+            query, method = (lambda: hierarchy.shortest_path(start, target)), ", hierarchy"
+        else:
+            query, method = (lambda: shortest_path(csr, start, target)), ""
+
+        def done(outcome):
+            (distance, path), elapsed = outcome
+            if path:
+                self.log(f"\n💠 Shortest Path {start} → {target}: {' → '.join(path)} (Distance {distance}{method})\n")
+            else:
+                self.log(f"\n💠 {target} is not reachable from {start}\n")
+            self.log(f"⏱ Execution Time: {elapsed:.6f} sec\n")
+
+        self.start_run("Shortest path query", lambda report: self.timed(query), done)
+
+    def run_delta(self):
+        # Parallel delta-stepping over every core, auto-tuned delta.
+        start = self.entry_start.get().upper()
+        csr = self.get_csr()
+        if start not in csr:
+            messagebox.showerror("Error", "Start vertex not found in graph!")
+            return
+        if csr.num_edges and csr.weight_range[0] < 0:
+            messagebox.showerror("Error", "Delta-stepping needs non-negative weights; use Bellman-Ford instead.")
+            return
+
+        version = self.version
+        title = f"🔷 Delta-Stepping Result from {start}"
+        cached = self.results.get("delta_stepping", start, version)
+        if cached is not None:
+            self.show_result(f"{title} (cached)", cached, 0.0)
+            return
+
+        def done(outcome):
+            result, elapsed = outcome
+            self.results.put("delta_stepping", start, version, result)
+            self.show_result(title, result, elapsed)
+
+        self.start_run("Delta-stepping", lambda report: self.timed(lambda: delta_stepping(csr, start, report)), done)
+
+    def run_all_pairs(self):
+        # Floyd-Warshall for small graphs, shown as a heatmap. If start and
+        # target are filled in, their path comes from the next-hop matrix.
+        csr = self.get_csr()
+        if not csr.num_vertices:
+            messagebox.showerror("Error", "No graph data available!")
+            return
+        if csr.num_vertices > FLOYD_MAX_VERTICES:
+            messagebox.showerror("Error", f"All pairs is limited to {FLOYD_MAX_VERTICES:,} vertices.")
+            return
+        start = self.entry_start.get().upper()
+        target = self.entry_target.get().upper()
+        query = start in csr and target in csr
+
+        def done(outcome):
+            (distance, nxt), elapsed = outcome
+            self.log(f"\n🔳 All-pairs distances for {csr.num_vertices:,} vertices "
+                     f"({int(np.isfinite(distance).sum()):,} reachable pairs)\n")
+            self.log(f"⏱ Execution Time: {elapsed:.6f} sec\n")
+            if query:
+                path = matrix_path(nxt, csr.index[start], csr.index[target])
+                if path:
+                    labels = [csr.labels[v] for v in path]
+                    distance_text = format_distance(distance[csr.index[start], csr.index[target]])
+                    self.log(f"💠 Shortest Path {start} → {target}: {' → '.join(labels)} (Distance {distance_text})\n")
+                else:
+                    self.log(f"💠 {target} is not reachable from {start}\n")
+            draw_matrix(distance, csr.labels)
+
+        self.start_run("Floyd-Warshall",
+                       lambda report: self.timed(lambda: floyd_warshall(csr, query, report)), done)
 
     def run_bellman(self):
         start = self.entry_start.get().upper()
-        if start not in self.graph:
+        if start not in self.get_csr():
             messagebox.showerror("Error", "Start vertex not found in graph!")
             return
-        start_time = time.time()
-        result = bellman_ford(self.graph, len(self.graph), start)
-        end_time = time.time()
-        if result is not None:
-            self.output_text.insert(tk.END, f"\n🔶 Bellman-Ford Result from {start}: {result}\n")
-            self.output_text.insert(tk.END, f"⏱ Execution Time: {end_time - start_time:.6f} sec\n")
+
+        version = self.version
+        stats = self.new_stats("bellman_ford", start)
+        cached = self.results.get("bellman_ford", start, version)
+        if cached is not None and stats is None:
+            self.show_bellman(start, cached, 0.0, True)
+            return
+
+        csr = self.get_csr()
+
+        def task(report):
+            result, elapsed = self.timed(lambda: bellman_ford(csr, len(csr), start, report, stats))
+            # The queue-based engine finds the actual cycle as soon as it closes.
+            cycle = find_negative_cycle(csr, start) if result is None else None
+            return result, elapsed, cycle
+
+        def done(outcome):
+            result, elapsed, cycle = outcome
+            self.report_stats(stats, elapsed)
+            if result is None:
+                self.log(f"\n⚠ Negative weight cycle: {' → '.join(cycle)}\n")
+                messagebox.showerror("Error", f"Graph contains a negative weight cycle!\n{' → '.join(cycle)}")
+                return
+            self.results.put("bellman_ford", start, version, result)
+            self.show_bellman(start, result, elapsed, False)
+
+        self.start_run("Bellman-Ford", task, done)
+
+    def show_bellman(self, start, result, elapsed, cached):
+        self.show_result(f"🔶 Bellman-Ford Result from {start}{' (cached)' if cached else ''}", result, elapsed)
+
+    def show_result(self, title, result, elapsed):
+        # Small results are printed inline; large ones only as a summary, with
+        # the full distance map in the paged result window.
+        if len(result) <= INLINE_RESULT_LIMIT:
+            self.log(f"\n{title}: {result}\n")
+        else:
+            table = ResultTable.from_map(result)
+            self.log(f"\n{title}: {table.summary()}\n")
+            self.result_window.show(title, table)
+        self.log(f"⏱ Execution Time: {elapsed:.6f} sec\n")
+
+    def run_replay(self):
+        # Records one run on the worker thread, then animates the event log.
+        csr = self.get_csr()
+        start = self.entry_start.get().upper()
+        if start not in csr:
+            messagebox.showerror("Error", "Start vertex not found in graph!")
+            return
+        algorithm = self.replay_choice.get()
+        if algorithm == "Dijkstra" and csr.num_edges and csr.weight_range[0] < 0:
+            messagebox.showerror("Error", "Dijkstra needs non-negative weights; replay Bellman-Ford instead.")
+            return
+        source = csr.index[start]
+
+        def done(outcome):
+            (distances, log), elapsed = outcome
+            self.log(f"\n🎞 Recorded {len(log):,} {algorithm} events in {elapsed:.6f} sec "
+                     f"(space: play/pause, ←/→: step)\n")
+            if distances is None:
+                self.log("⚠ Graph contains a negative weight cycle; replaying the passes up to it.\n")
+            pos = self.cached_layout("fast", lambda: fast_layout(csr))
+            Replay(csr, pos, log, source).show()
+
+        self.start_run(f"Recording {algorithm}",
+                       lambda report: self.timed(lambda: RECORDERS[algorithm](csr, source)), done)
+
+    def cached_layout(self, kind, compute):
+        # Layouts are only recomputed when the graph version changes.
+        if self.layout_key != (kind, self.version):
+            self.layout = compute()
+            self.layout_key = (kind, self.version)
+        return self.layout
 
     def show_graph(self):
-        if not self.graph:
+        csr = self.get_csr()
+        if not csr.num_vertices:
             messagebox.showerror("Error", "No graph data available!")
             return
+        view = self.view_choice.get()
+        if csr.num_vertices > LARGE_GRAPH or view != "Full graph":
+            self.show_large_graph(csr, view)
+            return
+
+        import networkx as nx
+        import matplotlib.pyplot as plt
         G = nx.DiGraph()
-        for u in self.graph:
-            for v, w in self.graph[u]:
-                G.add_edge(u, v, weight=w)
+        for u, v, w in csr.edges():
+            G.add_edge(csr.labels[u], csr.labels[v], weight=w)
 
-        pos = nx.spring_layout(G, seed=42)
+        pos = self.cached_layout("spring", lambda: nx.spring_layout(G, seed=42))
         plt.figure(figsize=(8, 5))
         nx.draw(G, pos, with_labels=True, node_color="#48cae4", node_size=2500,
                 font_size=12, font_weight="bold", edgecolors="#03045e", arrows=True)
@@ -173,8 +603,22 @@ class GraphGUI:
         plt.title("Graph Visualization", fontsize=14, fontweight="bold")
         plt.show()
 
+    def show_large_graph(self, csr, view):
+        # Batched, label-free drawing for big graphs or partial views.
+        source = csr.index.get(self.entry_start.get().upper())
+        pos = self.cached_layout("fast", lambda: fast_layout(csr))
+        try:
+            draw_large(csr, pos, view, source)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+
 
 # ---------------- Run the App ---------------- #
-root = tk.Tk()
-app = GraphGUI(root)
-root.mainloop()
+def main():
+    root = tk.Tk()
+    GraphGUI(root)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import heapq
+from daa_graph import INF
+from daa_spfa import spfa
+
+
+# ---------------- Helpers ---------------- #
+
+def build_path(parent, source, target):
+    path = [target]
+    while path[-1] != source:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+
+def path_labels(graph, path):
+    return [graph.labels[v] for v in path]
+
+
+# ---------------- Point-to-Point Queries ---------------- #
+# Each query returns (distance, path) with path as a list of vertex ids,
+# or (inf, []) when target is unreachable. Apart from label_correcting_path,
+# weights must be non-negative: the searches stop at the first settled target.
+
+def dijkstra_path(graph, source, target):
+    # Plain Dijkstra that stops as soon as target is settled.
+    return astar(graph, source, target)
+
+
+def astar(graph, source, target, heuristic=None):
+    # heuristic(v) must never overestimate the distance from v to target;
+    # without one this is Dijkstra with early exit. A vertex is expanded again
+    # whenever its distance improves, so an admissible but inconsistent
+    # heuristic still gives the shortest path (a consistent one never does).
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = {source: 0}
+    parent = {}
+    h = heuristic or (lambda v: 0)
+    pq = [(h(source), 0, source)]
+
+    while pq:
+        _, du, u = heapq.heappop(pq)
+        if du > distances[u]:
+            continue
+        if u == target:
+            return du, build_path(parent, source, target)
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            distance = du + weights[i]
+            if distance < distances.get(v, INF):
+                distances[v] = distance
+                parent[v] = u
+                heapq.heappush(pq, (distance + h(v), distance, v))
+    return INF, []
+
+
+def bidirectional_dijkstra(graph, source, target):
+    # Alternates a forward search from source with a backward search from
+    # target over the reversed graph and stops once the two frontiers can no
+    # longer improve the best meeting point.
+    if source == target:
+        return 0, [source]
+    sides = [graph, graph.reverse()]
+    distances = [{source: 0}, {target: 0}]
+    parents = [{}, {}]
+    settled = [set(), set()]
+    queues = [[(0, source)], [(0, target)]]
+    best, meet = INF, None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        du, u = heapq.heappop(queues[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        side_graph, dist, other = sides[side], distances[side], distances[1 - side]
+        offsets, targets, weights = side_graph.offsets, side_graph.targets, side_graph.weights
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            distance = du + weights[i]
+            if distance < dist.get(v, INF):
+                dist[v] = distance
+                parents[side][v] = u
+                heapq.heappush(queues[side], (distance, v))
+            if v in other and distance + other[v] < best:
+                best, meet = distance + other[v], v
+
+    if meet is None:
+        return INF, []
+    forward = build_path(parents[0], source, meet)
+    backward = build_path(parents[1], target, meet)
+    backward.reverse()
+    return best, forward + backward[1:]
+
+
+def label_correcting_path(graph, source, target):
+    # Negative weights allowed: SPFA from source, then the tree path to target.
+    # Raises ValueError if a negative cycle is reachable from source.
+    parent = [-1] * graph.num_vertices
+    distances, cycle = spfa(graph, source, parent=parent)
+    if distances is None:
+        names = " -> ".join(str(graph.labels[v]) for v in cycle + cycle[:1])
+        raise ValueError(f"Graph contains a negative weight cycle: {names}")
+    if distances[target] == INF:
+        return INF, []
+    return distances[target], build_path(parent, source, target)
+
+
+def shortest_path(graph, start, target, method="bidirectional", heuristic=None):
+    # Label-level entry point: returns (distance, [labels]). On a graph with
+    # negative weights every method falls back to label_correcting_path.
+    source, goal = graph.index[start], graph.index[target]
+    if method not in ("bidirectional", "astar", "dijkstra"):
+        raise ValueError(f"Unknown query method: {method}")
+    if graph.num_edges and graph.weight_range[0] < 0:
+        distance, path = label_correcting_path(graph, source, goal)
+    elif method == "bidirectional":
+        distance, path = bidirectional_dijkstra(graph, source, goal)
+    elif method == "astar":
+        distance, path = astar(graph, source, goal, heuristic)
+    else:
+        distance, path = dijkstra_path(graph, source, goal)
+    return distance, path_labels(graph, path)
@@ -0,0 +1,168 @@
+import numpy as np
+from daa_graph import dijkstra_csr
+from daa_vectorized import edge_arrays, bellman_ford_vectorized
+
+LARGE_GRAPH = 300
+
+
+# ---------------- Layout ---------------- #
+
+def undirected_adjacency(graph):
+    src, dst, _ = edge_arrays(graph)
+    both_src = np.concatenate([src, dst])
+    both_dst = np.concatenate([dst, src])
+    order = np.argsort(both_src, kind="stable")
+    offsets = np.zeros(graph.num_vertices + 1, dtype=np.int64)
+    np.cumsum(np.bincount(both_src, minlength=graph.num_vertices), out=offsets[1:])
+    return offsets, both_dst[order]
+
+
+def expand(offsets, targets, frontier):
+    # All out-neighbours of the frontier vertices, without a Python loop.
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    return targets[np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())]
+
+
+def bfs_hops(offsets, targets, source, n):
+    hops = np.full(n, -1, dtype=np.int64)
+    hops[source] = 0
+    frontier = np.array([source])
+    level = 0
+    while len(frontier):
+        level += 1
+        reached = expand(offsets, targets, frontier)
+        frontier = np.unique(reached[hops[reached] < 0])
+        hops[frontier] = level
+    return hops
+
+
+def fast_layout(graph, pivots=10, iterations=15, seed=42):
+    # High-dimensional embedding layout, O(pivots * (V + E)): BFS hop
+    # distances from max-min spread pivots are projected onto their two
+    # principal axes, then a few cheap spring passes along the edges smooth it.
+    n = graph.num_vertices
+    rng = np.random.default_rng(seed)
+    if n < 3:
+        return rng.random((n, 2))
+    offsets, targets = undirected_adjacency(graph)
+
+    columns = []
+    nearest = np.full(n, np.iinfo(np.int64).max)
+    pivot = int(rng.integers(n))
+    for _ in range(min(pivots, n)):
+        hops = bfs_hops(offsets, targets, pivot, n)
+        nearest = np.minimum(nearest, np.where(hops < 0, n, hops))
+        # Other components sit at the centre instead of forming a far-off cluster.
+        hops = hops.astype(np.float64)
+        hops[hops < 0] = hops[hops >= 0].mean()
+        columns.append(hops)
+        pivot = int(np.argmax(nearest))
+    embedding = np.stack(columns, axis=1)
+    embedding -= embedding.mean(axis=0)
+    _, _, axes = np.linalg.svd(embedding, full_matrices=False)
+    pos = embedding @ axes[:2].T
+    pos += rng.normal(0, 0.05, size=pos.shape)
+
+    src, dst, _ = edge_arrays(graph)
+    degree = np.maximum(np.bincount(src, minlength=n) + np.bincount(dst, minlength=n), 1)
+    for _ in range(iterations):
+        delta = pos[dst] - pos[src]
+        for axis in range(2):
+            pos[:, axis] += 0.3 * (np.bincount(src, delta[:, axis], minlength=n)
+                                   - np.bincount(dst, delta[:, axis], minlength=n)) / degree
+    lo, hi = pos.min(axis=0), pos.max(axis=0)
+    return (pos - lo) / np.maximum(hi - lo, 1e-12)
+
+
+# ---------------- Subgraph Views ---------------- #
+# Each view returns (vertex mask, edge mask) over the CSR edge order.
+
+def full_view(graph, source=None):
+    return np.ones(graph.num_vertices, dtype=bool), np.ones(graph.num_edges, dtype=bool)
+
+
+def tree_view(graph, source):
+    # Shortest-path tree from source: one tight edge (dist[u] + w == dist[v]) per reached vertex.
+    src, dst, w = edge_arrays(graph)
+    if graph.num_edges and w.min() < 0:
+        distance, _ = bellman_ford_vectorized(graph, source)
+        if distance is None:
+            raise ValueError("Graph contains a negative weight cycle!")
+    else:
+        distance = np.array(dijkstra_csr(graph, source), dtype=np.float64)
+    tight = np.flatnonzero(np.isfinite(distance[src]) & (distance[src] + w == distance[dst]) & (dst != source))
+    _, first = np.unique(dst[tight], return_index=True)
+    edges = np.zeros(graph.num_edges, dtype=bool)
+    edges[tight[first]] = True
+    return np.isfinite(distance), edges
+
+
+def neighbourhood_view(graph, source, hops=2):
+    # Vertices within `hops` out-edges of source and the edges among them.
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    targets = np.frombuffer(graph.targets, dtype=np.int32)
+    vertices = np.zeros(graph.num_vertices, dtype=bool)
+    vertices[source] = True
+    frontier = np.array([source])
+    for _ in range(hops):
+        if not len(frontier):
+            break
+        reached = expand(offsets, targets, frontier)
+        frontier = np.unique(reached[~vertices[reached]])
+        vertices[frontier] = True
+    src, dst, _ = edge_arrays(graph)
+    return vertices, vertices[src] & vertices[dst]
+
+
+VIEWS = {
+    "Full graph": full_view,
+    "Shortest-path tree": tree_view,
+    "Neighbourhood": neighbourhood_view,
+}
+
+
+# ---------------- Drawing ---------------- #
+
+def draw_large(graph, pos, view="Full graph", source=None, title="Graph Visualization"):
+    # Nodes as one scatter and edges as one LineCollection, without labels.
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    if view != "Full graph" and source is None:
+        raise ValueError("This view needs a start vertex.")
+    vertices, edges = VIEWS[view](graph, source)
+    src, dst, _ = edge_arrays(graph)
+    segments = np.stack([pos[src[edges]], pos[dst[edges]]], axis=1)
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.add_collection(LineCollection(segments, colors="#03045e", linewidths=0.4, alpha=0.35))
+    shown = np.flatnonzero(vertices)
+    size = max(1.0, min(30.0, 6000.0 / max(len(shown), 1)))
+    ax.scatter(pos[shown, 0], pos[shown, 1], s=size, c="#48cae4", edgecolors="none", zorder=2)
+    if source is not None:
+        ax.scatter(pos[source, 0], pos[source, 1], s=size * 8, c="#ef476f", zorder=3)
+    ax.set_aspect("equal")
+    ax.autoscale_view()
+    ax.axis("off")
+    ax.set_title(f"{title} — {view} ({len(shown):,} vertices, {int(edges.sum()):,} edges)",
+                 fontsize=12, fontweight="bold")
+    plt.show()
+
+
+def draw_matrix(distance, labels, title="All-Pairs Distances"):
+    # Heatmap of a distance matrix; unreachable pairs are left blank and
+    # vertex labels are only drawn when they stay legible.
+    import matplotlib.pyplot as plt
+    n = len(labels)
+    fig, ax = plt.subplots(figsize=(7, 6))
+    image = ax.imshow(np.ma.masked_invalid(np.where(np.isinf(distance), np.nan, distance)),
+                      cmap="viridis", interpolation="nearest")
+    fig.colorbar(image, ax=ax, label="distance")
+    if n <= 40:
+        ax.set_xticks(range(n), labels, rotation=90, fontsize=8)
+        ax.set_yticks(range(n), labels, fontsize=8)
+    ax.set_xlabel("target")
+    ax.set_ylabel("source")
+    reachable = int(np.isfinite(distance).sum())
+    ax.set_title(f"{title} ({n:,} vertices, {reachable:,} reachable pairs)", fontsize=12, fontweight="bold")
+    plt.show()
@@ -0,0 +1,241 @@
+import heapq
+from array import array
+import numpy as np
+from daa_graph import INF
+from daa_vectorized import edge_arrays
+
+# Step-by-step replay without re-running anything: one recorded run fills a
+# compact event log, and the figure derives the state at any event from it.
+
+SETTLE, RELAX, PASS = 0, 1, 2
+
+
+# ---------------- Event Log ---------------- #
+
+class EventLog:
+    # Parallel typed arrays, one entry per event: kind, vertex (settled or
+    # improved; the pass number for PASS), CSR edge index (-1 if none) and
+    # the distance at that moment. About 21 bytes per event.
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.kinds = array('b')
+        self.vertices = array('i')
+        self.edges = array('q')
+        self.distances = array('d')
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def append(self, kind, vertex, edge, distance):
+        self.kinds.append(kind)
+        self.vertices.append(vertex)
+        self.edges.append(edge)
+        self.distances.append(distance)
+
+    def as_arrays(self):
+        return (np.frombuffer(self.kinds, dtype=np.int8), np.frombuffer(self.vertices, dtype=np.int32),
+                np.frombuffer(self.edges, dtype=np.int64), np.frombuffer(self.distances, dtype=np.float64))
+
+
+def record_dijkstra(graph, source):
+    # dijkstra_csr, logging every settlement and successful relaxation.
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    log = EventLog("Dijkstra")
+    event = log.append
+    distances = [INF] * graph.num_vertices
+    distances[source] = 0
+    pq = [(0, source)]
+
+    while pq:
+        current_distance, u = heapq.heappop(pq)
+        if current_distance > distances[u]:
+            continue
+        event(SETTLE, u, -1, current_distance)
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            distance = current_distance + weights[i]
+            if distance < distances[v]:
+                distances[v] = distance
+                heapq.heappush(pq, (distance, v))
+                event(RELAX, v, i, distance)
+    return distances, log
+
+
+def record_bellman_ford(graph, source):
+    # Pass-by-pass Bellman-Ford with early stop, logging successful
+    # relaxations and a PASS marker after each pass. Distances are None on
+    # a negative cycle; the log still shows the first |V| - 1 passes.
+    n = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    log = EventLog("Bellman-Ford")
+    event = log.append
+    distances = [INF] * n
+    distances[source] = 0
+
+    for number in range(1, n + 1):
+        changed = False
+        for u in range(n):
+            du = distances[u]
+            if du == INF:
+                continue
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if du + weights[i] < distances[v]:
+                    if number == n:
+                        return None, log
+                    distances[v] = du + weights[i]
+                    event(RELAX, v, i, distances[v])
+                    changed = True
+        event(PASS, number, -1, 0)
+        if not changed:
+            break
+    return distances, log
+
+
+RECORDERS = {
+    "Dijkstra": record_dijkstra,
+    "Bellman-Ford": record_bellman_ford,
+}
+
+
+# ---------------- Replay ---------------- #
+
+UNSEEN, REACHED, SETTLED = "#adb5bd", "#ffd166", "#48cae4"
+EDGE_IDLE, EDGE_USED = (0.01, 0.02, 0.37, 0.15), (0.01, 0.02, 0.37, 0.8)
+
+
+class Replay:
+    # State at event t (t events applied) comes from per-vertex and per-edge
+    # first-event times, so any t can be shown directly. Moving from t0 to
+    # t1 only recolours the vertices and edges named by events in between,
+    # and with blitting only the animated artists are redrawn per frame.
+    def __init__(self, graph, pos, log, source, fps=30, duration=20.0):
+        self.graph, self.pos, self.log, self.source = graph, pos, log, source
+        self.kinds, self.vertices, self.edges, self.values = log.as_arrays()
+        self.total = len(log)
+        self.fps = fps
+        # Events per frame, so a full replay takes roughly `duration` seconds at fps.
+        self.step = max(1, int(np.ceil(self.total / (fps * duration))))
+        self.t = 0
+        self.playing = True
+
+        never = self.total + 1
+        self.reached_at = self.first_times(self.kinds == RELAX, self.vertices, graph.num_vertices, never)
+        self.reached_at[source] = 0
+        self.settled_at = self.first_times(self.kinds == SETTLE, self.vertices, graph.num_vertices, never)
+        self.used_at = self.first_times(self.kinds == RELAX, self.edges, graph.num_edges, never)
+
+    @staticmethod
+    def first_times(mask, keys, size, never):
+        # Event index (1-based: state after it) at which each key first appears.
+        times = np.full(size, never, dtype=np.int64)
+        events = np.flatnonzero(mask)
+        unique, first = np.unique(keys[events], return_index=True)
+        times[unique] = events[first] + 1
+        return times
+
+    def vertex_colors(self, vertices, t):
+        return np.where(self.settled_at[vertices] <= t, 2, np.where(self.reached_at[vertices] <= t, 1, 0))
+
+    def show(self):
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import to_rgba_array
+        from matplotlib.widgets import Slider
+
+        src, dst, _ = edge_arrays(self.graph)
+        self.palette = to_rgba_array([UNSEEN, REACHED, SETTLED])
+        self.edge_palette = to_rgba_array([EDGE_IDLE, EDGE_USED])
+
+        fig = plt.figure(figsize=(8, 7))
+        ax = fig.add_axes([0.02, 0.16, 0.96, 0.78])
+        ax.axis("off")
+        ax.set_title(f"{self.log.algorithm} replay — {self.total:,} events", fontsize=12, fontweight="bold")
+        self.edge_colors = np.repeat(self.edge_palette[:1], self.graph.num_edges, axis=0)
+        self.edge_art = LineCollection(np.stack([self.pos[src], self.pos[dst]], axis=1),
+                                       colors=self.edge_colors, linewidths=0.6, animated=True)
+        ax.add_collection(self.edge_art)
+        size = max(4.0, min(120.0, 8000.0 / max(self.graph.num_vertices, 1)))
+        self.node_colors = self.palette[self.vertex_colors(np.arange(self.graph.num_vertices), 0)]
+        self.node_art = ax.scatter(self.pos[:, 0], self.pos[:, 1], s=size, c=self.node_colors,
+                                   edgecolors="none", zorder=2, animated=True)
+        ax.scatter(self.pos[self.source, 0], self.pos[self.source, 1], s=size * 4, c="#ef476f", zorder=3)
+        self.cursor = ax.scatter([], [], s=size * 3, facecolors="none", edgecolors="#ef476f",
+                                 zorder=4, animated=True)
+        self.caption = ax.text(0.01, 0.01, "", transform=ax.transAxes, fontsize=10, animated=True)
+        ax.set_aspect("equal")
+        ax.autoscale_view()
+
+        self.scrubber = Slider(fig.add_axes([0.12, 0.08, 0.76, 0.03]), "Event", 0, max(self.total, 1),
+                               valinit=0, valstep=1)
+        self.scrubber.on_changed(lambda value: self.seek(int(value)))
+        rate = Slider(fig.add_axes([0.12, 0.03, 0.76, 0.03]), "FPS", 1, 60, valinit=self.fps, valstep=1)
+        rate.on_changed(self.set_fps)
+        fig.canvas.mpl_connect("key_press_event", self.on_key)
+
+        self.animation = FuncAnimation(fig, self.frame, interval=1000 / self.fps, blit=True,
+                                       cache_frame_data=False)
+        plt.show()
+
+    def artists(self):
+        return self.edge_art, self.node_art, self.cursor, self.caption
+
+    def frame(self, _):
+        if self.playing and self.t < self.total:
+            self.move(min(self.total, self.t + self.step))
+        return self.artists()
+
+    def move(self, t):
+        # Recolour only what the events between the old and new position touch.
+        lo, hi = sorted((self.t, t))
+        self.t = t
+        touched = self.vertices[lo:hi][self.kinds[lo:hi] != PASS]
+        if len(touched):
+            touched = np.unique(touched)
+            self.node_colors[touched] = self.palette[self.vertex_colors(touched, t)]
+            self.node_art.set_facecolor(self.node_colors)
+        edges = self.edges[lo:hi]
+        edges = edges[edges >= 0]
+        if len(edges):
+            self.edge_colors[edges] = self.edge_palette[(self.used_at[edges] <= t).astype(np.int64)]
+            self.edge_art.set_color(self.edge_colors)
+        self.update_cursor()
+
+    def update_cursor(self):
+        if self.t == 0:
+            self.cursor.set_offsets(np.empty((0, 2)))
+            self.caption.set_text(f"0 / {self.total:,}")
+            return
+        i = self.t - 1
+        kind, vertex = int(self.kinds[i]), int(self.vertices[i])
+        labels = self.graph.labels
+        if kind == PASS:
+            self.cursor.set_offsets(np.empty((0, 2)))
+            text = f"pass {vertex} done"
+        else:
+            self.cursor.set_offsets(self.pos[vertex:vertex + 1])
+            verb = "settle" if kind == SETTLE else "relax"
+            text = f"{verb} {labels[vertex]} = {self.values[i]:g}"
+        self.caption.set_text(f"{self.t:,} / {self.total:,}   {text}")
+
+    def seek(self, t):
+        # Scrubbing pauses playback; the slider redraw refreshes the blit background.
+        self.playing = False
+        self.move(t)
+
+    def set_fps(self, fps):
+        self.fps = fps
+        self.animation.event_source.interval = 1000 / fps
+
+    def on_key(self, event):
+        # Space plays/pauses, arrow keys step by one frame's worth of events.
+        if event.key == " ":
+            self.playing = not self.playing
+            if self.playing and self.t >= self.total:
+                self.move(0)
+        elif event.key in ("left", "right"):
+            self.playing = False
+            step = self.step if event.key == "right" else -self.step
+            self.move(max(0, min(self.total, self.t + step)))
+            self.scrubber.set_val(self.t)
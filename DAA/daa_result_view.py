@@ -0,0 +1,92 @@
+import tkinter as tk
+from tkinter import messagebox, filedialog, ttk
+
+PAGE_SIZE = 100
+
+
+# ---------------- Result Window ---------------- #
+
+class ResultWindow:
+    # Paged, sortable and searchable table over a ResultTable. Only the
+    # current page of rows is ever inserted into the Treeview.
+    def __init__(self, root):
+        self.root = root
+        self.window = None
+        self.table = None
+
+    def show(self, title, table):
+        self.table = table
+        self.sort, self.descending, self.page_number = "distance", False, 0
+        if self.window is None or not self.window.winfo_exists():
+            self.build()
+        self.window.title(title)
+        self.search_entry.delete(0, tk.END)
+        self.summary_label.config(text=table.summary())
+        self.refresh()
+        self.window.lift()
+
+    def build(self):
+        self.window = tk.Toplevel(self.root)
+        self.window.geometry("520x520")
+        self.window.configure(bg="#0b132b")
+
+        self.summary_label = tk.Label(self.window, text="", font=("Poppins", 10), fg="#c0c0c0",
+                                      bg="#0b132b", wraplength=480, justify="left")
+        self.summary_label.pack(pady=(10, 5), padx=10, anchor="w")
+
+        search_frame = tk.Frame(self.window, bg="#0b132b")
+        search_frame.pack(fill="x", padx=10)
+        self.search_entry = tk.Entry(search_frame, font=("Poppins", 11), bg="#3a506b", fg="white", bd=0)
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        self.search_entry.bind("<Return>", lambda e: self.search())
+        tk.Button(search_frame, text="Search", command=self.search, relief="flat").pack(side="left")
+        tk.Button(search_frame, text="Export", command=self.export, relief="flat").pack(side="left", padx=5)
+
+        self.tree = ttk.Treeview(self.window, columns=("vertex", "distance"), show="headings", height=18)
+        for column in ("vertex", "distance"):
+            self.tree.heading(column, text=column.title(), command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=220, anchor="center")
+        self.tree.pack(fill="both", expand=True, padx=10, pady=5)
+
+        nav_frame = tk.Frame(self.window, bg="#0b132b")
+        nav_frame.pack(pady=5)
+        tk.Button(nav_frame, text="◀ Prev", command=lambda: self.turn(-1), relief="flat").grid(row=0, column=0)
+        self.page_label = tk.Label(nav_frame, text="", font=("Poppins", 10), fg="white", bg="#0b132b", width=24)
+        self.page_label.grid(row=0, column=1)
+        tk.Button(nav_frame, text="Next ▶", command=lambda: self.turn(1), relief="flat").grid(row=0, column=2)
+
+    def rows(self):
+        return self.table.order(self.sort, self.descending, self.search_entry.get().strip())
+
+    def refresh(self):
+        rows = self.rows()
+        pages = max(1, -(-len(rows) // PAGE_SIZE))
+        self.page_number = min(self.page_number, pages - 1)
+        self.tree.delete(*self.tree.get_children())
+        for label, distance in self.table.page(rows, self.page_number, PAGE_SIZE):
+            self.tree.insert("", tk.END, values=(label, distance))
+        self.page_label.config(text=f"Page {self.page_number + 1} / {pages:,}  ({len(rows):,} rows)")
+
+    def turn(self, step):
+        self.page_number = max(0, self.page_number + step)
+        self.refresh()
+
+    def sort_by(self, column):
+        self.descending = not self.descending if self.sort == column else False
+        self.sort, self.page_number = column, 0
+        self.refresh()
+
+    def search(self):
+        self.page_number = 0
+        self.refresh()
+
+    def export(self):
+        path = filedialog.asksaveasfilename(
+            parent=self.window, title="Export Results", defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("Parquet", "*.parquet")])
+        if not path:
+            return
+        try:
+            self.table.export(path, self.rows())
+        except (OSError, RuntimeError) as e:
+            messagebox.showerror("Export Failed", str(e), parent=self.window)
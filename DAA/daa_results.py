@@ -0,0 +1,104 @@
+import csv
+import numpy as np
+
+# Array-backed view of one shortest-path result: sorting, searching and
+# paging work on index arrays, so nothing renders more rows than it shows.
+
+
+def format_distance(distance):
+    if distance == np.inf:
+        return "∞"
+    return str(int(distance)) if float(distance).is_integer() else f"{distance:g}"
+
+
+class ResultTable:
+    def __init__(self, labels, distances):
+        self.labels = labels
+        self.distances = np.asarray(distances, dtype=np.float64)
+        self._orders = {}
+
+    @classmethod
+    def from_map(cls, result):
+        return cls(list(result), list(result.values()))
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def reachable(self):
+        return int(np.isfinite(self.distances).sum())
+
+    @property
+    def unreachable(self):
+        return len(self.labels) - self.reachable
+
+    # ---- Views ---- #
+    def order(self, sort="distance", descending=False, query=""):
+        # Row indices for a sort key ("distance", "vertex" or None) and a
+        # case-insensitive label filter, cached per combination.
+        key = (sort, descending, query.upper())
+        if key not in self._orders:
+            if sort == "distance":
+                rows = np.argsort(self.distances, kind="stable")
+            elif sort == "vertex":
+                rows = np.argsort(np.array(self.labels, dtype=object), kind="stable")
+            else:
+                rows = np.arange(len(self.labels))
+            if descending:
+                rows = rows[::-1]
+            if query:
+                needle = query.upper()
+                keep = np.fromiter((needle in str(label).upper() for label in self.labels),
+                                   dtype=bool, count=len(self.labels))
+                rows = rows[keep[rows]]
+            self._orders[key] = rows
+        return self._orders[key]
+
+    def page(self, rows, number, size=100):
+        chunk = rows[number * size:(number + 1) * size]
+        return [(self.labels[i], format_distance(self.distances[i])) for i in chunk.tolist()]
+
+    def nearest(self, k=10):
+        finite = np.flatnonzero(np.isfinite(self.distances))
+        if len(finite) > k:
+            finite = finite[np.argpartition(self.distances[finite], k)[:k]]
+        finite = finite[np.argsort(self.distances[finite], kind="stable")]
+        return [(self.labels[i], format_distance(self.distances[i])) for i in finite.tolist()]
+
+    def summary(self, k=5):
+        nearest = ", ".join(f"{label} {distance}" for label, distance in self.nearest(k))
+        return f"{self.reachable:,} reachable, {self.unreachable:,} unreachable — nearest: {nearest}"
+
+    # ---- Export ---- #
+    def export_csv(self, path, rows=None, chunk=100_000):
+        rows = np.arange(len(self.labels)) if rows is None else rows
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["vertex", "distance"])
+            for lo in range(0, len(rows), chunk):
+                part = rows[lo:lo + chunk].tolist()
+                values = [int(d) if d != np.inf and d.is_integer() else d for d in self.distances[part].tolist()]
+                writer.writerows(zip([self.labels[i] for i in part], values))
+
+    def export_parquet(self, path, rows=None, chunk=100_000):
+        # pyarrow is optional and only needed for this format.
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet export needs the pyarrow package.") from None
+        rows = np.arange(len(self.labels)) if rows is None else rows
+        schema = pa.schema([("vertex", pa.string()), ("distance", pa.float64())])
+        with pq.ParquetWriter(path, schema) as writer:
+            for lo in range(0, len(rows), chunk):
+                part = rows[lo:lo + chunk]
+                writer.write_table(pa.table({
+                    "vertex": [str(self.labels[i]) for i in part.tolist()],
+                    "distance": self.distances[part],
+                }, schema=schema))
+
+    def export(self, path, rows=None):
+        if path.lower().endswith(".parquet"):
+            self.export_parquet(path, rows)
+        else:
+            self.export_csv(path, rows)
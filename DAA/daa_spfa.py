@@ -0,0 +1,97 @@
+from collections import deque
+from daa_graph import INF
+
+# Queue-based Bellman-Ford (SPFA) with Tarjan's subtree disassembly: only
+# out-edges of vertices whose distance changed are relaxed, and when v
+# improves its whole subtree in the current shortest-path tree is detached,
+# because those distances are now stale. If the vertex doing the relaxing is
+# itself inside that subtree, the tree path plus the new edge is a negative
+# cycle, which is found the moment it closes instead of after |V| passes.
+
+
+def spfa(graph, source, progress=None, every=4096, parent=None):
+    # Returns (distances, None) or (None, cycle) where cycle lists the vertex
+    # ids of a negative cycle in edge order. parent, if given as a list of
+    # num_vertices -1s, is left holding the shortest-path tree.
+    n = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = [INF] * n
+    parent = [-1] * n if parent is None else parent
+    children = [[] for _ in range(n)]
+    queued = [False] * n
+    distances[source] = 0
+    queue = deque([source])
+    queued[source] = True
+    pops = 0
+
+    while queue:
+        u = queue.popleft()
+        if not queued[u]:
+            continue  # detached by a disassembly after it was queued
+        queued[u] = False
+        if progress is not None:
+            pops += 1
+            if pops % every == 0:
+                progress(min(pops, n), n)
+        du = distances[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            distance = du + weights[i]
+            if distance >= distances[v]:
+                continue
+            if v == u or detach_subtree(v, u, parent, children, queued):
+                return None, tree_cycle(parent, v, u)
+            distances[v] = distance
+            if parent[v] != u:
+                parent[v] = u
+                children[u].append(v)
+            if not queued[v]:
+                queued[v] = True
+                queue.append(v)
+    return distances, None
+
+
+def detach_subtree(root, u, parent, children, queued):
+    # Detaches every descendant of root, unless u is one of them: then the
+    # new edge closes a cycle, the tree is left intact for tree_cycle and
+    # True is returned. children lists are pruned lazily: an entry only
+    # counts while its parent pointer still points back.
+    subtree = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for child in children[node]:
+            if parent[child] == node:
+                if child == u:
+                    return True
+                subtree.append(child)
+                stack.append(child)
+    children[root] = []
+    for node in subtree:
+        parent[node] = -1
+        queued[node] = False
+        children[node] = []
+    return False
+
+
+def tree_cycle(parent, v, u):
+    # Tree path v -> ... -> u; the relaxed edge u -> v closes it.
+    path = [u]
+    while path[-1] != v:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+
+def spfa_distances(graph, source, progress=None):
+    distances, _ = spfa(graph, source, progress)
+    return distances
+
+
+def negative_cycle(graph, source):
+    # Labels of a negative cycle reachable from source (first vertex repeated
+    # at the end), or None.
+    _, cycle = spfa(graph, source)
+    if cycle is None:
+        return None
+    return [graph.labels[v] for v in cycle + cycle[:1]]
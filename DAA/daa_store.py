@@ -0,0 +1,120 @@
+import mmap
+import os
+import struct
+import tempfile
+from contextlib import contextmanager
+from daa_graph import CSRGraph
+
+# Binary graph file (little-endian, every section 8-byte aligned):
+#   header   magic, format version, weight typecode ('q' int64 / 'd' float64),
+#            vertex and edge counts, then the byte offset of each section
+#   labels   UTF-8 vertex labels joined by '\n'
+#   offsets  int64[n + 1]
+#   targets  int32[m]
+#   weights  int64[m] or float64[m]
+# Loading maps the file read-only, so the arrays are used in place without
+# parsing and processes opening the same file share its pages.
+
+MAGIC = b"DAAGRAPH"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIc3xQQQQQQQ")
+EXTENSION = ".daag"
+
+
+def align(position):
+    return (position + 7) & ~7
+
+
+def is_binary_graph(path):
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+# ---------------- Save ---------------- #
+
+@contextmanager
+def replace_file(path):
+    # Writes to a temporary file next to path and moves it over path only once
+    # complete. Never truncating path in place matters because the graph being
+    # saved may be memory-mapped from that very file.
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temporary = tempfile.mkstemp(prefix=".tmp-", suffix=os.path.splitext(path)[1], dir=directory)
+    try:
+        with os.fdopen(handle, "wb") as f:
+            yield f
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        raise
+
+
+def save_binary(graph, path):
+    if any("\n" in label for label in graph.labels):
+        raise ValueError("Vertex labels may not contain newlines.")
+    labels = "\n".join(graph.labels).encode("utf-8")
+    n, m = graph.num_vertices, graph.num_edges
+    weight_code = b"q" if graph.integer_weights else b"d"
+
+    labels_at = align(HEADER.size)
+    offsets_at = align(labels_at + len(labels))
+    targets_at = offsets_at + 8 * (n + 1)
+    weights_at = align(targets_at + 4 * m)
+
+    with replace_file(path) as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, weight_code, n, m,
+                            labels_at, len(labels), offsets_at, targets_at, weights_at))
+        for position, section in ((labels_at, labels), (offsets_at, graph.offsets),
+                                  (targets_at, graph.targets), (weights_at, graph.weights)):
+            f.write(b"\0" * (position - f.tell()))
+            f.write(memoryview(section).cast("B"))
+
+
+# ---------------- Load ---------------- #
+
+def check_mapping(mapped, path, sections, offsets_at, n, m):
+    # Raises ValueError unless every (start, size) section lies inside the
+    # file and the offsets run from 0 to m. Reads through struct, not views,
+    # so a failed check leaves nothing that would keep the mapping open.
+    for start, size in sections:
+        if start + size > len(mapped):
+            raise ValueError(f"{path} is truncated or corrupt.")
+    first, last = struct.unpack_from("<q", mapped, offsets_at)[0], struct.unpack_from("<q", mapped, offsets_at + 8 * n)[0]
+    if first != 0 or last != m:
+        raise ValueError(f"{path} is corrupt: edge offsets do not match the edge count.")
+
+
+def load_binary(path):
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(mapped) < HEADER.size:
+            raise ValueError(f"{path} is not a binary graph file.")
+        magic, version, weight_code, n, m, labels_at, labels_size, offsets_at, targets_at, weights_at = \
+            HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a binary graph file.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported graph file version {version}.")
+        if weight_code not in (b"q", b"d"):
+            raise ValueError(f"{path} is corrupt: unknown weight type {weight_code!r}.")
+        check_mapping(mapped, path, [(labels_at, labels_size), (offsets_at, 8 * (n + 1)),
+                                     (targets_at, 4 * m), (weights_at, 8 * m)], offsets_at, n, m)
+        labels = mapped[labels_at:labels_at + labels_size].decode("utf-8").split("\n") if n else []
+        if len(labels) != n:
+            raise ValueError(f"{path} is corrupt: expected {n} labels, found {len(labels)}.")
+    except BaseException:
+        mapped.close()
+        raise
+
+    view = memoryview(mapped)
+    graph = CSRGraph(
+        labels,
+        view[offsets_at:offsets_at + 8 * (n + 1)].cast("q"),
+        view[targets_at:targets_at + 4 * m].cast("i"),
+        view[weights_at:weights_at + 8 * m].cast(weight_code.decode()),
+    )
+    graph.mapped_file = mapped  # keeps the mapping alive as long as the graph
+    return graph
@@ -0,0 +1,130 @@
+import heapq
+import json
+import os
+import time
+from daa_graph import INF
+
+# Operation counters for one algorithm run. Engines only touch a RunStats
+# when one is passed in: Dijkstra switches to the counted copy below of the
+# engine it would have used (heapq or Dial's buckets), so the normal engines
+# carry no per-operation bookkeeping at all. For Dial's buckets the heap
+# counters count bucket operations.
+
+COUNTERS = ("heap_pushes", "heap_pops", "stale_pops", "relaxations", "improvements", "passes")
+
+
+class RunStats:
+    def __init__(self, algorithm, source):
+        self.algorithm = algorithm
+        self.source = source
+        self.engine = None  # queue the counted engine used, "heapq" or "dial"
+        self.elapsed = 0.0
+        for name in COUNTERS:
+            setattr(self, name, 0)
+
+    def as_dict(self):
+        record = {"algorithm": self.algorithm, "source": self.source, "engine": self.engine,
+                  "elapsed": self.elapsed}
+        record.update((name, getattr(self, name)) for name in COUNTERS)
+        return record
+
+    def format(self):
+        # Only the counters the algorithm actually uses, e.g. no heap for Bellman-Ford.
+        parts = [f"{name.replace('_', ' ')} {getattr(self, name):,}"
+                 for name in COUNTERS if getattr(self, name)]
+        if self.engine == "dial":
+            parts = [part.replace("heap", "bucket") for part in parts]
+        text = ", ".join(parts) or "no operations"
+        return f"{text} ({self.engine})" if self.engine else text
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def trace_path(self, directory):
+        # One file per run: <algorithm>_<source>_<timestamp>.json
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        safe = "".join(c if c.isalnum() else "_" for c in str(self.source))
+        return os.path.join(directory, f"{self.algorithm}_{safe}_{stamp}.json")
+
+
+# ---------------- Counted Dijkstra ---------------- #
+
+def counted_dijkstra(graph, source, stats, progress=None, every=4096):
+    # dijkstra_csr with counters kept in locals and stored once at the end.
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = [INF] * graph.num_vertices
+    distances[source] = 0
+    pq = [(0, source)]
+    pushes, pops, stale, relaxations, improvements = 1, 0, 0, 0, 0
+    settled = 0
+
+    while pq:
+        current_distance, u = heapq.heappop(pq)
+        pops += 1
+        if current_distance > distances[u]:
+            stale += 1
+            continue
+        settled += 1
+        if progress is not None and settled % every == 0:
+            progress(settled, len(distances))
+        start, end = offsets[u], offsets[u + 1]
+        relaxations += end - start
+        for i in range(start, end):
+            v = targets[i]
+            distance = current_distance + weights[i]
+            if distance < distances[v]:
+                distances[v] = distance
+                heapq.heappush(pq, (distance, v))
+                improvements += 1
+                pushes += 1
+
+    stats.engine = "heapq"
+    stats.heap_pushes, stats.heap_pops, stats.stale_pops = pushes, pops, stale
+    stats.relaxations, stats.improvements = relaxations, improvements
+    return distances
+
+
+def counted_dial_dijkstra(graph, source, max_weight, stats, progress=None, every=4096):
+    # daa_buckets.dial_dijkstra with the same counters; pushes and pops are
+    # bucket appends and pops.
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    size = max_weight + 1
+    buckets = [[] for _ in range(size)]
+    distances = [INF] * graph.num_vertices
+    distances[source] = 0
+    buckets[0].append(source)
+    pending, d, settled = 1, 0, 0
+    pushes, pops, stale, relaxations, improvements = 1, 0, 0, 0, 0
+
+    while pending:
+        bucket = buckets[d % size]
+        while not bucket:
+            d += 1
+            bucket = buckets[d % size]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            pops += 1
+            if distances[u] != d:
+                stale += 1
+                continue
+            settled += 1
+            if progress is not None and settled % every == 0:
+                progress(settled, len(distances))
+            start, end = offsets[u], offsets[u + 1]
+            relaxations += end - start
+            for i in range(start, end):
+                v = targets[i]
+                distance = d + weights[i]
+                if distance < distances[v]:
+                    distances[v] = distance
+                    buckets[distance % size].append(v)
+                    pending += 1
+                    improvements += 1
+                    pushes += 1
+
+    stats.engine = "dial"
+    stats.heap_pushes, stats.heap_pops, stats.stale_pops = pushes, pops, stale
+    stats.relaxations, stats.improvements = relaxations, improvements
+    return distances
@@ -0,0 +1,66 @@
+import queue
+import threading
+
+
+class RunCancelled(Exception):
+    pass
+
+
+# ---------------- Background Runs ---------------- #
+
+class BackgroundRun:
+    # Runs task(report) on a worker thread so the Tk main loop never blocks.
+    # The task calls report(done, total) to publish progress; once cancel() is
+    # requested the next report raises RunCancelled inside the worker.
+    # Callbacks are delivered on the Tk thread by polling with root.after:
+    # on_progress(done, total), on_done(result), on_error(exception).
+    def __init__(self, root, task, on_done, on_progress=None, on_error=None, poll_ms=50):
+        self.root = root
+        self.task = task
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.poll_ms = poll_ms
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+        self.finished = False
+
+    def start(self):
+        threading.Thread(target=self._work, daemon=True).start()
+        self.root.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def _report(self, done, total):
+        if self.cancelled.is_set():
+            raise RunCancelled()
+        self.events.put(("progress", (done, total)))
+
+    def _work(self):
+        try:
+            self.events.put(("done", self.task(self._report)))
+        except Exception as e:
+            self.events.put(("error", e))
+
+    def _poll(self):
+        latest = None
+        while True:
+            try:
+                kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                latest = payload
+                continue
+            self.finished = True
+            if kind == "done":
+                self.on_done(payload)
+            elif self.on_error is not None:
+                self.on_error(payload)
+        # Only the newest progress update per tick is worth drawing.
+        if latest is not None and not self.finished and self.on_progress is not None:
+            self.on_progress(*latest)
+        if not self.finished:
+            self.root.after(self.poll_ms, self._poll)